@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for BBC Sport, replaying the recorded pages in benchmarks/fixtures/
+
+Serves the scores-fixtures and table URLs the scraper requests, with optional
+latency, random errors, ETag/304 handling and live matches that evolve over
+time (scripted or random goals), so polling, caching and concurrency can be
+load-tested repeatably without network access.
+
+Usage:
+  python benchmarks/bbc_standin.py --port 8080 --latency 80 --jitter 40 --error-rate 0.02
+  python benchmarks/bbc_standin.py --goal-every 15          # A random live goal every 15s
+  python benchmarks/bbc_standin.py --script goals.json      # Scripted match events
+  FOOTYRES_BBC_URL=http://127.0.0.1:8080 python football_scraper.py --serve
+
+A script is a JSON list of {"at": seconds, "match": "Arsenal", "type": "goal",
+"side": "home", "player": "Saka"}; type is goal, red_card, kick_off,
+half_time or full_time and match is a substring of either team name.
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+from fixtures import (
+    BUSY_DAY,
+    EMPTY_DAY,
+    decode_initial_data,
+    fixture_names,
+    initial_data_page,
+    load_page,
+)
+
+FIXTURES_PATH = re.compile(r"^/sport/football/scores-fixtures(?:/(\d{4}-\d{2}-\d{2}))?/?$")
+TABLE_PATH = re.compile(r"^(?:/sport)?/football/(?:([a-z0-9-]+)/table|tables)/?$")
+
+
+class LiveDay:
+    """Today's fixtures page with matches that change as scripted events fire"""
+
+    def __init__(self, page: bytes, script: List[Dict], goal_every: float, seed: int):
+        self.data = decode_initial_data(page)
+        self.script = sorted(script, key=lambda event: event["at"])
+        self.goal_every = goal_every
+        self.rng = random.Random(seed)
+        self.started = time.time()
+        self.applied = 0
+        self.random_goals = 0
+        self.lock = threading.Lock()
+        self.version = 0
+        self._page: Optional[bytes] = None
+
+    def events(self) -> List[Dict]:
+        fixtures = next(iter(self.data.values()))["data"]
+        return [
+            event
+            for group in fixtures.get("eventGroups", [])
+            for secondary in group.get("secondaryGroups", [])
+            for event in secondary.get("events", [])
+        ]
+
+    def find(self, team: str) -> Optional[Dict]:
+        team = team.lower()
+        for event in self.events():
+            if team in event["home"]["fullName"].lower() or team in event["away"]["fullName"].lower():
+                return event
+        return None
+
+    def apply(self, event: Dict, change: Dict):
+        change_type = change.get("type", "goal")
+        side = event[change.get("side", "home")]
+        minute = change.get("minute") or self.rng.randint(1, 90)
+        if change_type == "goal":
+            side["score"] = str(int(side.get("score") or 0) + 1)
+            side.setdefault("actions", []).append(
+                {
+                    "actionType": "goal",
+                    "playerName": change.get("player", "Substitute"),
+                    "actions": [{"type": "Goal", "timeLabel": {"value": f"{minute}'"}}],
+                }
+            )
+            if event["status"] == "MidEvent":
+                event["periodLabel"] = {"value": f"{minute}'"}
+        elif change_type == "red_card":
+            side.setdefault("actions", []).append(
+                {
+                    "actionType": "card",
+                    "playerName": change.get("player", "Defender"),
+                    "actions": [{"type": "Red Card", "timeLabel": {"value": f"{minute}'"}}],
+                }
+            )
+        elif change_type == "kick_off":
+            event["status"] = "MidEvent"
+            event["periodLabel"] = {"value": "1'"}
+        elif change_type == "half_time":
+            event["status"] = "MidEvent"
+            event["periodLabel"] = {"value": "HT"}
+        elif change_type == "full_time":
+            event["status"] = "PostEvent"
+            event["periodLabel"] = {"value": "FT"}
+
+    def advance(self):
+        """Apply every scripted/random change that is due by now"""
+        elapsed = time.time() - self.started
+        changed = False
+        while self.applied < len(self.script) and self.script[self.applied]["at"] <= elapsed:
+            change = self.script[self.applied]
+            self.applied += 1
+            event = self.find(change["match"])
+            if event is not None:
+                self.apply(event, change)
+                changed = True
+
+        if self.goal_every > 0:
+            while self.random_goals < int(elapsed // self.goal_every):
+                self.random_goals += 1
+                live = [event for event in self.events() if event["status"] == "MidEvent"]
+                if live:
+                    event = self.rng.choice(live)
+                    self.apply(event, {"type": "goal", "side": self.rng.choice(["home", "away"])})
+                    changed = True
+
+        if changed or self._page is None:
+            self.version += 1
+            self._page = initial_data_page(self.data, "Football Scores & Fixtures")
+
+    def page(self) -> bytes:
+        with self.lock:
+            self.advance()
+            return self._page
+
+
+class StandIn:
+    """Pages, fault injection settings and request counters shared by all handlers"""
+
+    def __init__(
+        self,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        error_rate: float = 0,
+        goal_every: float = 0,
+        script: Optional[List[Dict]] = None,
+        seed: int = 1,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+        self.pages = {name: load_page(name) for name in fixture_names()}
+        self.live = LiveDay(self.pages[BUSY_DAY], script or [], goal_every, seed)
+        self.counters = {"requests": 0, "200": 0, "304": 0, "404": 0, "503": 0}
+        self.counters_lock = threading.Lock()
+
+    def count(self, key: str):
+        with self.counters_lock:
+            self.counters[key] = self.counters.get(key, 0) + 1
+
+    def delay_and_fail(self) -> bool:
+        """Sleep for the configured latency; True if this request should fail"""
+        with self.rng_lock:
+            delay = self.latency_ms + self.rng.uniform(-self.jitter_ms, self.jitter_ms)
+            fail = self.rng.random() < self.error_rate
+        if delay > 0:
+            time.sleep(delay / 1000)
+        return fail
+
+    def resolve(self, path: str) -> Optional[bytes]:
+        match = FIXTURES_PATH.match(path)
+        if match:
+            day = match.group(1)
+            if day is None or day == date.today().isoformat():
+                return self.live.page()
+            # Other dates replay the recorded pages: every third day is an empty one
+            return self.pages[BUSY_DAY if date.fromisoformat(day).toordinal() % 3 else EMPTY_DAY]
+
+        match = TABLE_PATH.match(path)
+        if match:
+            slug = match.group(1) or "premier-league"
+            return self.pages.get(f"table-{slug}")
+        return None
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 drops SYNs under load, adding 1-3s retransmit stalls
+    request_queue_size = 256
+
+
+def make_handler(standin: StandIn):
+    class StandInHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, like the real site
+        server_version = "bbc-standin/1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def send_body(self, status: int, body: bytes, headers: Dict[str, str]):
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if self.command != "HEAD":
+                self.wfile.write(body)
+
+        def do_HEAD(self):
+            self.do_GET()
+
+        def do_GET(self):
+            standin.count("requests")
+            path = self.path.split("?", 1)[0]
+            if path == "/__stats":
+                with standin.counters_lock:
+                    stats = dict(standin.counters, live_version=standin.live.version)
+                self.send_body(200, json.dumps(stats).encode(), {"Content-Type": "application/json"})
+                return
+
+            if standin.delay_and_fail():
+                standin.count("503")
+                self.send_body(503, b"Service Unavailable", {"Content-Type": "text/plain"})
+                return
+
+            page = standin.resolve(path)
+            if page is None:
+                standin.count("404")
+                self.send_body(404, b"Not Found", {"Content-Type": "text/plain"})
+                return
+
+            etag = f'"{hashlib.sha1(page).hexdigest()[:16]}"'
+            if etag in self.headers.get("If-None-Match", ""):
+                standin.count("304")
+                self.send_body(304, b"", {"ETag": etag})
+                return
+
+            headers = {
+                "Content-Type": "text/html; charset=utf-8",
+                "ETag": etag,
+                "Cache-Control": "max-age=10",
+            }
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                page = gzip.compress(page, compresslevel=5)
+                headers["Content-Encoding"] = "gzip"
+            standin.count("200")
+            self.send_body(200, page, headers)
+
+    return StandInHandler
+
+
+def start_standin(host: str = "127.0.0.1", port: int = 0, **options) -> Tuple[ThreadingHTTPServer, str]:
+    """Start a stand-in on a background thread; returns (server, site root URL)"""
+    server = StandInServer((host, port), make_handler(StandIn(**options)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_port}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local BBC Sport stand-in for load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0, metavar="MS", help="Mean response delay")
+    parser.add_argument("--jitter", type=float, default=0, metavar="MS", help="Uniform +/- delay jitter")
+    parser.add_argument("--error-rate", type=float, default=0, help="Fraction of requests answered 503")
+    parser.add_argument("--goal-every", type=float, default=0, metavar="SECONDS", help="Random live goal interval")
+    parser.add_argument("--script", metavar="FILE", help="JSON list of timed match events")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    script = []
+    if args.script:
+        with open(args.script) as f:
+            script = json.load(f)
+
+    server = StandInServer(
+        (args.host, args.port),
+        make_handler(
+            StandIn(args.latency, args.jitter, args.error_rate, args.goal_every, script, args.seed)
+        ),
+    )
+    url = f"http://{args.host}:{server.server_port}"
+    print(f"BBC stand-in serving {url} (stats at {url}/__stats)")
+    print(f"Point the scraper at it: FOOTYRES_BBC_URL={url} python football_scraper.py")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
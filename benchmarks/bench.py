@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Offline benchmarks for the Football Results Scraper
+
+Times the page parsers and terminal renderers against the recorded pages in
+benchmarks/fixtures/ (see fixtures.py), so no network access is needed.
+Reports ops/sec, mean time per call, tracemalloc peak memory per call and,
+on Linux, the peak RSS growth of one cold call in a fresh interpreter.
+
+Usage:
+  python benchmarks/bench.py                      # Run every case
+  python benchmarks/bench.py -k table             # Only cases containing "table"
+  python benchmarks/bench.py --save before.json   # Save results...
+  python benchmarks/bench.py --compare before.json  # ...and diff a later run against them
+"""
+
+import argparse
+import atexit
+import contextlib
+import gc
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from typing import Optional
+
+# Add parent directory to path so we can import the scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fixtures import BUSY_DAY, EMPTY_DAY, TEXT_DAY, load_page, table_fixture_name
+
+from football_scraper import FootballScraper, SnapshotStore, make_soup
+from football_standings import is_live, project_table
+from football_stats import SeasonStore
+
+
+def initial_data(scraper: FootballScraper, page: bytes) -> dict:
+    """The fixtures 'data' dict that extract_json_matches hands to process_json_match_data"""
+    captured = {}
+    original = scraper.process_json_match_data
+    scraper.process_json_match_data = lambda data: captured.setdefault("data", data)
+    try:
+        scraper.extract_json_matches(make_soup(page))
+    finally:
+        scraper.process_json_match_data = original
+    return captured["data"]
+
+
+def build_cases(scraper: FootballScraper) -> list:
+    """Return [(name, zero-argument callable)] for every benchmark case"""
+    busy_page = load_page(BUSY_DAY)
+    busy_soup = make_soup(busy_page)
+    empty_soup = make_soup(load_page(EMPTY_DAY))
+    text_soup = make_soup(load_page(TEXT_DAY))
+    busy_data = initial_data(scraper, busy_page)
+    busy_matches = scraper.process_json_match_data(busy_data)
+
+    cases = [
+        ("refresh[fixtures busy]", lambda: scraper.parse_matches_page(busy_page)),
+        ("parse_bbc_matches[busy, from bytes]", lambda: scraper.parse_bbc_matches(make_soup(busy_page))),
+        ("extract_json_matches[busy]", lambda: scraper.extract_json_matches(busy_soup)),
+        ("extract_json_matches[empty]", lambda: scraper.extract_json_matches(empty_soup)),
+        # Repeat polls only read the actions added since the last one; a first poll formats them all
+        ("process_json_match_data[busy]", lambda: scraper.process_json_match_data(busy_data)),
+        (
+            "process_json_match_data[busy, first poll]",
+            lambda: (scraper._action_logs.clear(), scraper.process_json_match_data(busy_data)),
+        ),
+        ("parse_text_matches[text]", lambda: scraper.parse_text_matches(text_soup)),
+    ]
+
+    tables = {}
+    for key, league in scraper.leagues.items():
+        if key == "0":
+            continue
+        league_name = league["name"]
+        page = load_page(table_fixture_name(league))
+        if league_name == "Premier League":
+            cases.append(
+                (f"refresh[table {league_name}]", lambda page=page: scraper.parse_table_page(page, "Premier League"))
+            )
+        soup = make_soup(page)
+        if league_name == "MLS":
+            cases.append(
+                (f"extract_mls_conferences[{league_name}]", lambda soup=soup: scraper.extract_mls_conferences(soup))
+            )
+            tables[league_name] = scraper.extract_mls_conferences(soup)
+        else:
+            cases.append(
+                (
+                    f"extract_json_table_data[{league_name}]",
+                    lambda soup=soup, name=league_name: scraper.extract_json_table_data(soup, name),
+                )
+            )
+            tables[league_name] = scraper.extract_json_table_data(soup, league_name)
+
+    for league_name in ("Premier League", "UEFA Champions League", "MLS"):
+        cases.append(
+            (
+                f"render_league_table[{league_name}]",
+                lambda name=league_name: scraper.render_league_table(name, tables[name]),
+            )
+        )
+
+    live = [match for match in busy_matches["Premier League"] if is_live(match)]
+    cases.append(
+        (
+            "project_table[Premier League, live]",
+            lambda: project_table(tables["Premier League"], live, "Premier League"),
+        )
+    )
+
+    # A season of the busy day's results, every league, as --stats sees it
+    store = SeasonStore()
+    for day in range(200):
+        date_str = (date(2025, 8, 1) + timedelta(days=day)).isoformat()
+        for league, matches in busy_matches.items():
+            for match in matches:
+                store.apply(date_str, league, dict(match, status="FT"))
+
+    def season_stats_all_leagues():
+        for league in busy_matches:
+            rows = store.rows(league, start="2025-08-01")
+            store.summary(rows)
+            store.scoring_streaks(rows)
+
+    cases.append((f"season_stats[{len(store)} matches, all leagues]", season_stats_all_leagues))
+
+    def display_all_leagues():
+        for league, matches in busy_matches.items():
+            scraper.display_league_matches(league, matches)
+
+    cases.append(("display_league_matches[busy, all leagues]", display_all_leagues))
+
+    # A single-league view: only the shown league's scorers and cards are read
+    def show_one_league():
+        scraper._action_logs.clear()
+        matches = scraper.process_json_match_data(busy_data)
+        scraper.display_league_matches("Premier League", matches["Premier League"])
+
+    cases.append(("fixtures to view[busy, Premier League]", show_one_league))
+
+    # The same with the snapshot every fetch writes, as fetch_matches does it
+    cache_dir = tempfile.mkdtemp(prefix="footyres-bench-")
+    atexit.register(shutil.rmtree, cache_dir, ignore_errors=True)
+    storing = FootballScraper()
+    storing.clear_screen = lambda: None
+    storing.snapshots = SnapshotStore(cache_dir)
+
+    def store_and_show_one_league():
+        storing._action_logs.clear()
+        matches = storing.store_matches(
+            date(2025, 8, 16), storing.process_json_match_data(busy_data)
+        )
+        storing.display_league_matches("Premier League", matches["Premier League"])
+
+    cases.append(("fixtures to view[busy, Premier League, stored]", store_and_show_one_league))
+    return cases
+
+
+def measure(fn, min_time: float) -> dict:
+    """Run fn repeatedly for at least min_time seconds, then once under tracemalloc"""
+    fn()  # warm up caches and lazy imports
+
+    calls = 0
+    batch = 1
+    started = time.perf_counter()
+    while True:
+        for _ in range(batch):
+            fn()
+        calls += batch
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            break
+        batch = min(batch * 2, 1000)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "ops_per_sec": calls / elapsed,
+        "mean_ms": elapsed / calls * 1000,
+        "peak_kb": peak / 1024,
+    }
+
+
+def proc_status_kb(field: str) -> int:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+    raise OSError(f"{field} not in /proc/self/status")
+
+
+def peak_rss_growth_kb(fn) -> Optional[float]:
+    """How far one call of fn pushes peak RSS above the current RSS (Linux only)"""
+    gc.collect()
+    try:
+        # Writing 5 to clear_refs resets VmHWM (the peak) to the current RSS
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        baseline = proc_status_kb("VmRSS")
+        fn()
+        return float(proc_status_kb("VmHWM") - baseline)
+    except OSError:
+        return None
+
+
+def cold_rss_kb(name: str) -> Optional[float]:
+    """Run a case once in a fresh interpreter, where the allocator has no free memory to reuse"""
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--rss-case", name],
+        capture_output=True,
+        text=True,
+    )
+    try:
+        return json.loads(result.stdout.splitlines()[-1])["peak_rss_kb"]
+    except (IndexError, ValueError, KeyError):
+        return None
+
+
+def run_rss_case(scraper: FootballScraper, name: str):
+    """Child side of cold_rss_kb: print the RSS growth of one call as JSON"""
+    report = sys.stdout
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        fn = dict(build_cases(scraper))[name]
+        peak = peak_rss_growth_kb(fn)
+    print(json.dumps({"peak_rss_kb": peak}), file=report)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline parser and renderer benchmarks")
+    parser.add_argument("-k", dest="keyword", help="Only run cases whose name contains this")
+    parser.add_argument(
+        "--min-time", type=float, default=0.5, help="Seconds to run each case (default 0.5)"
+    )
+    parser.add_argument("--save", metavar="FILE", help="Write results as JSON")
+    parser.add_argument("--compare", metavar="FILE", help="Show change against saved results")
+    parser.add_argument("--no-rss", action="store_true", help="Skip the per-case peak RSS runs")
+    parser.add_argument("--rss-case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+
+    scraper = FootballScraper()
+    scraper.clear_screen = lambda: None  # renderers clear the terminal via a subprocess
+
+    if args.rss_case:
+        run_rss_case(scraper, args.rss_case)
+        return
+
+    report = sys.stdout
+    results = {}
+    # Parsers and renderers print diagnostics; keep them out of the timings and the report
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        cases = build_cases(scraper)
+        print(f"{'case':<48} {'ops/sec':>10} {'mean ms':>9} {'peak KB':>9} {'RSS KB':>8}", file=report)
+        print("-" * 88, file=report)
+        for name, fn in cases:
+            if args.keyword and args.keyword.lower() not in name.lower():
+                continue
+            result = measure(fn, args.min_time)
+            result["peak_rss_kb"] = None if args.no_rss else cold_rss_kb(name)
+            results[name] = result
+
+            rss = "-" if result["peak_rss_kb"] is None else f"{result['peak_rss_kb']:.0f}"
+            line = f"{name:<48} {result['ops_per_sec']:>10.1f} {result['mean_ms']:>9.3f} {result['peak_kb']:>9.1f} {rss:>8}"
+            if name in baseline:
+                change = result["ops_per_sec"] / baseline[name]["ops_per_sec"] - 1
+                line += f"  {change:+.0%}"
+            print(line, file=report, flush=True)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(
+                {"python": sys.version.split()[0], "results": results}, f, indent=2
+            )
+        print(f"\nSaved results to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
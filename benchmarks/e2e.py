@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+End-to-end throughput and tail-latency test against the local BBC stand-in
+
+Starts bbc_standin in-process, points a FootballScraper at it and runs fetches
+(fixtures page + a league table) from several threads, reporting throughput and
+latency percentiles plus the process's peak RSS. Snapshots go to a temporary directory so the real cache
+is never touched.
+
+Usage:
+  python benchmarks/e2e.py --requests 200 --concurrency 8 --latency 50 --jitter 25
+  python benchmarks/e2e.py --error-rate 0.05       # See how failures show up in the tail
+  python benchmarks/e2e.py --async --concurrency 100  # One thread, AsyncFootballScraper
+"""
+
+import argparse
+import asyncio
+import contextlib
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+# Add parent directory to path so we can import the scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bbc_standin import start_standin
+
+from football_scraper import FootballScraper, HostThrottle, SnapshotStore
+
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far (None where unsupported)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end fetch load test (offline)")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=50, metavar="MS")
+    parser.add_argument("--jitter", type=float, default=25, metavar="MS")
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--goal-every", type=float, default=1, metavar="SECONDS")
+    parser.add_argument(
+        "--rate", type=float, default=0, metavar="PER_SECOND", help="Scraper rate limit (default off)"
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Run the fetches as AsyncFootballScraper coroutines (concurrency = threads behind them)",
+    )
+    args = parser.parse_args()
+
+    server, url = start_standin(
+        latency_ms=args.latency,
+        jitter_ms=args.jitter,
+        error_rate=args.error_rate,
+        goal_every=args.goal_every,
+    )
+    scraper = FootballScraper(site_url=url)
+    scraper.snapshots = SnapshotStore(tempfile.mkdtemp(prefix="footyres-e2e-"))
+    scraper.throttle = HostThrottle(rate=args.rate)
+
+    jobs = [
+        ("fixtures", lambda: scraper.fetch_matches(0)),
+        ("table", lambda: scraper.fetch_league_table("1")),
+    ]
+    timings = {name: [] for name, _ in jobs}
+    failures = {name: 0 for name, _ in jobs}
+    lock = threading.Lock()
+
+    def run(i: int):
+        name, fetch = jobs[i % len(jobs)]
+        started = time.perf_counter()
+        result = fetch()
+        elapsed = (time.perf_counter() - started) * 1000
+        with lock:
+            timings[name].append(elapsed)
+            if not result:
+                failures[name] += 1
+
+    async def run_async():
+        from football_async import AsyncFootballScraper
+
+        async with AsyncFootballScraper(scraper, max_connections=args.concurrency) as client:
+            async_jobs = {
+                "fixtures": lambda: client.fetch_matches(0),
+                "table": lambda: client.fetch_league_table("1"),
+            }
+            slots = asyncio.Semaphore(args.concurrency)
+
+            async def run_one(i: int):
+                name = jobs[i % len(jobs)][0]
+                async with slots:
+                    started = time.perf_counter()
+                    result = await async_jobs[name]()
+                    timings[name].append((time.perf_counter() - started) * 1000)
+                    if not result:
+                        failures[name] += 1
+
+            await asyncio.gather(*(run_one(i) for i in range(args.requests)))
+
+    print(
+        f"{args.requests} fetches, {args.concurrency} {'tasks' if args.use_async else 'threads'}, "
+        f"{args.latency:g}±{args.jitter:g} ms latency, {args.error_rate:.0%} errors"
+    )
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        started = time.perf_counter()
+        if args.use_async:
+            asyncio.run(run_async())
+        else:
+            with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+                list(pool.map(run, range(args.requests)))
+        wall = time.perf_counter() - started
+
+    print(f"{'fetch':<10} {'count':>6} {'failed':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for name, values in timings.items():
+        if not values:
+            continue
+        print(
+            f"{name:<10} {len(values):>6} {failures[name]:>7} {percentile(values, 0.5):>8.1f} "
+            f"{percentile(values, 0.95):>8.1f} {percentile(values, 0.99):>8.1f} {max(values):>8.1f}"
+        )
+    print(f"\nThroughput: {args.requests / wall:.1f} fetches/sec over {wall:.2f}s")
+    peak = peak_rss_mb()
+    if peak is not None:
+        print(f"Peak RSS: {peak:.1f} MB")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Recorded-page corpus for the offline benchmarks
+
+Pages are stored gzip-compressed in benchmarks/fixtures/ and mirror what BBC
+Sport serves: fixtures pages with window.__INITIAL_DATA__, football-table JSON
+for each league and the two HTML conference tables for MLS. Run this file to
+regenerate the corpus (deterministic, seeded) or drop real recordings in with
+the same names.
+"""
+
+import gzip
+import json
+import os
+import random
+import sys
+
+# Add parent directory to path so we can import the scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from football_scraper import reference_data
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+BUSY_DAY = "scores-fixtures-busy"
+EMPTY_DAY = "scores-fixtures-empty"
+TEXT_DAY = "scores-fixtures-text"
+
+# BBC group labels for leagues the scraper skips; busy days are full of them
+OTHER_COMPETITIONS = [
+    "Championship",
+    "League One",
+    "League Two",
+    "Scottish Premiership",
+    "National League",
+]
+
+CHAMPIONS_LEAGUE_TEAMS = [
+    "Real Madrid", "Barcelona", "Bayern Munich", "Manchester City", "Arsenal",
+    "Liverpool", "Paris Saint-Germain", "Inter Milan", "Juventus", "Atletico Madrid",
+    "Borussia Dortmund", "Bayer Leverkusen", "Napoli", "Benfica", "Sporting CP",
+    "Chelsea", "Tottenham Hotspur", "Newcastle United", "Atalanta", "Monaco",
+    "Marseille", "Club Brugge", "PSV Eindhoven", "Ajax", "Galatasaray",
+    "Olympiakos", "Slavia Prague", "Copenhagen", "Bodo/Glimt", "Union St-Gilloise",
+    "Villarreal", "Athletic Club", "Eintracht Frankfurt", "Qarabag", "Pafos", "Kairat",
+]
+MLS_CONFERENCES = {
+    "Eastern Conference": [
+        "Philadelphia Union", "FC Cincinnati", "Inter Miami", "Charlotte FC",
+        "New York City FC", "Nashville SC", "Columbus Crew", "Orlando City",
+        "Chicago Fire", "New York Red Bulls", "New England Revolution",
+        "Toronto FC", "Atlanta United", "CF Montréal", "DC United",
+    ],
+    "Western Conference": [
+        "San Diego FC", "Vancouver Whitecaps", "LAFC", "Minnesota United",
+        "Seattle Sounders", "Austin FC", "San Jose Earthquakes", "Portland Timbers",
+        "Real Salt Lake", "Colorado Rapids", "FC Dallas", "Houston Dynamo",
+        "St. Louis City", "LA Galaxy", "Sporting KC",
+    ],
+}
+PLAYERS = [
+    "Saka", "Haaland", "Salah", "Kane", "Mbappe", "Vinicius Jr", "Lautaro",
+    "Osimhen", "Wirtz", "Musiala", "Gyokeres", "Palmer", "Isak", "Yamal",
+    "Lewandowski", "Dembele", "Messi", "Bouanga", "Vlahovic", "Leao",
+]
+
+
+def league_team_names(league_name: str) -> list:
+    if league_name == "UEFA Champions League":
+        return CHAMPIONS_LEAGUE_TEAMS
+    if league_name == "MLS":
+        return [*MLS_CONFERENCES["Eastern Conference"], *MLS_CONFERENCES["Western Conference"]]
+    teams = reference_data().canonical_teams.get(league_name)
+    if teams:
+        return list(teams)
+    return [f"{league_name} Club {i}" for i in range(1, 19)]
+
+
+def initial_data_page(data: dict, title: str) -> bytes:
+    """Wrap a data dict the way BBC Sport embeds it: an escaped JSON string literal"""
+    encoded = json.dumps({"data": data}).replace("\\", "\\\\").replace('"', '\\"')
+    return (
+        "<!DOCTYPE html><html lang=\"en-GB\"><head>"
+        f"<title>{title} - BBC Sport</title></head><body>"
+        "<div id=\"main-content\"><h1>" + title + "</h1></div>"
+        f"<script>window.__INITIAL_DATA__=\"{encoded}\";</script>"
+        "</body></html>"
+    ).encode("utf-8")
+
+
+def decode_initial_data(page: bytes) -> dict:
+    """Inverse of initial_data_page: the 'data' dict embedded in a recorded page"""
+    text = page.decode("utf-8")
+    start = text.index('window.__INITIAL_DATA__="') + len('window.__INITIAL_DATA__="')
+    end = text.index('";</script>', start)
+    return json.loads(text[start:end].replace('\\"', '"').replace("\\\\", "\\"))["data"]
+
+
+def goal_actions(rng: random.Random, goals: int) -> list:
+    actions = []
+    for _ in range(goals):
+        goal_type = rng.choice(["Goal", "Goal", "Goal", "Penalty", "Own Goal"])
+        actions.append(
+            {
+                "actionType": "goal",
+                "playerName": rng.choice(PLAYERS),
+                "actions": [{"type": goal_type, "timeLabel": {"value": f"{rng.randint(1, 90)}'"}}],
+            }
+        )
+    if rng.random() < 0.15:
+        actions.append(
+            {
+                "actionType": "card",
+                "playerName": rng.choice(PLAYERS),
+                "actions": [{"type": "Red Card", "timeLabel": {"value": f"{rng.randint(10, 90)}'"}}],
+            }
+        )
+    return actions
+
+
+def fixture_event(rng: random.Random, home: str, away: str, date_str: str, multi_leg: bool) -> dict:
+    state = rng.choice(["PostEvent", "PostEvent", "MidEvent", "MidEvent", "PreEvent"])
+    home_goals = rng.randint(0, 4) if state != "PreEvent" else 0
+    away_goals = rng.randint(0, 3) if state != "PreEvent" else 0
+    if state == "MidEvent":
+        period = rng.choice(["HT", f"{rng.randint(1, 90)}'", "90+3'"])
+    else:
+        period = "FT"
+
+    event = {
+        "id": f"{home}-{away}-{date_str}",
+        "status": state,
+        "periodLabel": {"value": period},
+        "statusComment": {"value": period},
+        "startDateTime": f"{date_str}T{rng.choice(['12:30', '15:00', '17:30', '20:00'])}:00Z",
+        "home": {
+            "fullName": home,
+            "shortName": home[:12],
+            "score": str(home_goals),
+            "actions": goal_actions(rng, home_goals),
+        },
+        "away": {
+            "fullName": away,
+            "shortName": away[:12],
+            "score": str(away_goals),
+            "actions": goal_actions(rng, away_goals),
+        },
+    }
+    if multi_leg:
+        event["multiLeg"] = {"leg": 2}
+        event["home"]["runningScores"] = {"aggregate": str(home_goals + rng.randint(0, 3))}
+        event["away"]["runningScores"] = {"aggregate": str(away_goals + rng.randint(0, 3))}
+    return event
+
+
+def fixtures_page(rng: random.Random, date_str: str, busy: bool) -> bytes:
+    groups = []
+    if busy:
+        names = [
+            league["name"]
+            for key, league in reference_data().leagues.items()
+            if key != "0"
+        ]
+        for label in [*names, *OTHER_COMPETITIONS]:
+            teams = league_team_names(label)
+            rng.shuffle(teams)
+            events = [
+                fixture_event(
+                    rng, teams[i], teams[i + 1], date_str, label == "UEFA Champions League" and i < 4
+                )
+                for i in range(0, min(len(teams), 20) - 1, 2)
+            ]
+            groups.append(
+                {
+                    "displayLabel": label,
+                    "secondaryGroups": [{"displayLabel": date_str, "events": events}],
+                }
+            )
+
+    data = {
+        "sport-data-scores-fixtures?selectedEndDate=" + date_str: {
+            "data": {"eventGroups": groups}
+        }
+    }
+    return initial_data_page(data, "Football Scores & Fixtures")
+
+
+def text_page(rng: random.Random) -> bytes:
+    """Fixtures page without embedded JSON, forcing the text fallback parser"""
+    lines = []
+    for league in ["Premier League", "La Liga", "Serie A", "Bundesliga", "Ligue 1"]:
+        teams = league_team_names(league)
+        rng.shuffle(teams)
+        lines.append(f"<h2>{league}</h2>")
+        for i in range(0, len(teams) - 1, 2):
+            # BBC's accessible score text, e.g. "Arsenal 2 , Chelsea 1 at Full time"
+            lines.append(
+                f"<p>{teams[i]} {rng.randint(0, 4)} , {teams[i + 1]} {rng.randint(0, 3)} at Full time</p>"
+            )
+            lines.append("<p>Watch highlights and reaction</p>")
+    return (
+        "<!DOCTYPE html><html><head><title>Football Scores - BBC Sport</title></head><body>"
+        + "\n".join(lines)
+        + "</body></html>"
+    ).encode("utf-8")
+
+
+def standings(rng: random.Random, teams: list, played: int) -> list:
+    rows = []
+    for team in teams:
+        won = rng.randint(0, played)
+        drawn = rng.randint(0, played - won)
+        lost = played - won - drawn
+        goals_for = won * 2 + drawn + rng.randint(0, 6)
+        goals_against = lost * 2 + drawn + rng.randint(0, 6)
+        rows.append(
+            {
+                "team": team,
+                "played": played,
+                "won": won,
+                "drawn": drawn,
+                "lost": lost,
+                "goals_for": goals_for,
+                "goals_against": goals_against,
+                "points": won * 3 + drawn,
+            }
+        )
+    rows.sort(key=lambda r: (-r["points"], -(r["goals_for"] - r["goals_against"])))
+    return rows
+
+
+def table_page(rng: random.Random, league_name: str) -> bytes:
+    team_ids = {name: team_id for team_id, name in reference_data().team_id_mapping.items()}
+    participants = []
+    for position, row in enumerate(standings(rng, league_team_names(league_name), 10), 1):
+        entry = {
+            "rank": position,
+            "played": row["played"],
+            "won": row["won"],
+            "drawn": row["drawn"],
+            "lost": row["lost"],
+            "goalsScoredFor": row["goals_for"],
+            "goalsScoredAgainst": row["goals_against"],
+            "goalDifference": row["goals_for"] - row["goals_against"],
+            "points": row["points"],
+            "formGuide": [
+                {"value": rng.choice("WWDL")} for _ in range(5)
+            ],
+        }
+        if row["team"] in team_ids:
+            entry["teamId"] = team_ids[row["team"]]
+        else:
+            entry["name"] = row["team"]
+        participants.append(entry)
+
+    data = {
+        "football-table?tournament=" + league_name.lower().replace(" ", "-"): {
+            "data": {
+                "tournaments": [
+                    {"stages": [{"rounds": [{"participants": participants}]}]}
+                ]
+            }
+        }
+    }
+    return initial_data_page(data, f"{league_name} Table")
+
+
+def mls_table_page(rng: random.Random) -> bytes:
+    """MLS is parsed from the two HTML conference tables, not from JSON"""
+    tables = []
+    for conference, teams in MLS_CONFERENCES.items():
+        rows = ["<tr><th>Team</th><th>P</th><th>W</th><th>D</th><th>L</th><th>F</th><th>A</th><th>GD</th><th>Pts</th></tr>"]
+        for position, row in enumerate(standings(rng, list(teams), 30), 1):
+            cells = [
+                f"{position}{row['team']}",
+                row["played"], row["won"], row["drawn"], row["lost"],
+                row["goals_for"], row["goals_against"],
+                row["goals_for"] - row["goals_against"], row["points"],
+            ]
+            rows.append("<tr>" + "".join(f"<td>{cell}</td>" for cell in cells) + "</tr>")
+        tables.append(f"<h2>{conference}</h2><table>{''.join(rows)}</table>")
+    return (
+        "<!DOCTYPE html><html><head><title>MLS Table - BBC Sport</title></head><body>"
+        + "".join(tables)
+        + "</body></html>"
+    ).encode("utf-8")
+
+
+def table_fixture_name(league: dict) -> str:
+    return f"table-{league['table_url']}"
+
+
+def build_corpus(seed: int = 2025) -> dict:
+    """Return {fixture name: page bytes} for the whole corpus"""
+    rng = random.Random(seed)
+    pages = {
+        BUSY_DAY: fixtures_page(rng, "2025-09-27", busy=True),
+        EMPTY_DAY: fixtures_page(rng, "2025-12-24", busy=False),
+        TEXT_DAY: text_page(rng),
+    }
+    for key, league in reference_data().leagues.items():
+        if key == "0":
+            continue
+        if league["name"] == "MLS":
+            pages[table_fixture_name(league)] = mls_table_page(rng)
+        else:
+            pages[table_fixture_name(league)] = table_page(rng, league["name"])
+    return pages
+
+
+def load_page(name: str) -> bytes:
+    with gzip.open(os.path.join(FIXTURES_DIR, f"{name}.html.gz"), "rb") as f:
+        return f.read()
+
+
+def fixture_names() -> list:
+    return sorted(
+        name[: -len(".html.gz")]
+        for name in os.listdir(FIXTURES_DIR)
+        if name.endswith(".html.gz")
+    )
+
+
+def write_corpus():
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    for name, page in build_corpus().items():
+        path = os.path.join(FIXTURES_DIR, f"{name}.html.gz")
+        with open(path, "wb") as f:
+            f.write(gzip.compress(page, mtime=0))
+        print(f"  {name}: {len(page) / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    print(f"Writing fixtures to {FIXTURES_DIR}")
+    write_corpus()
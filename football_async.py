@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+asyncio front end for the Football Results Scraper
+
+AsyncFootballScraper exposes fixture, table and stream-search fetches as
+coroutines for callers that already run an event loop. Each one runs the
+synchronous FootballScraper or StreamSearcher method on a bounded thread
+pool, so there is a single HTTP transport: the requests session, with its
+proxy settings, http_archive record/replay adapters, per-host throttle,
+circuit breakers and profiler spans. Results are identical to the
+synchronous methods, and the event loop never blocks on the network or on
+parsing.
+
+Usage:
+  async with AsyncFootballScraper() as client:
+      matches, table = await asyncio.gather(
+          client.fetch_matches(0), client.fetch_league_table("1")
+      )
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from football_scraper import SESSION_POOL_SIZE, FootballScraper, stream_site_domain
+
+
+class AsyncFootballScraper:
+    """Coroutine versions of FootballScraper's fetches, run on max_connections threads
+
+    Wraps a FootballScraper (created if not given). At most SESSION_POOL_SIZE
+    threads are used, the connections its session keeps per host. Pages are
+    parsed in parse_pool (see football_scraper.parse_pool) if given, else on
+    the fetching thread.
+    """
+
+    def __init__(
+        self,
+        scraper: Optional[FootballScraper] = None,
+        site_url: Optional[str] = None,
+        max_connections: int = 8,
+        parse_pool=None,
+    ):
+        self.scraper = scraper or FootballScraper(site_url)
+        self.parse_pool = parse_pool
+        self._threads = ThreadPoolExecutor(
+            max_workers=max(1, min(max_connections, SESSION_POOL_SIZE)),
+            thread_name_prefix="footyres-fetch",
+        )
+
+    async def __aenter__(self) -> "AsyncFootballScraper":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        # Fetches still queued are dropped; running ones finish on their threads
+        self._threads.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def leagues(self):
+        return self.scraper.leagues
+
+    async def _run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(
+            self._threads, functools.partial(fn, *args)
+        )
+
+    async def fetch_matches(self, date_offset: int = 0) -> Optional[Dict]:
+        """Fetch and parse matches for today (0), yesterday (-1), tomorrow (1), ..."""
+        return await self.fetch_matches_for_date(date.today() + timedelta(days=date_offset))
+
+    async def fetch_matches_for_date(self, target_date: date) -> Optional[Dict]:
+        """Fetch and parse the scores-fixtures page for a calendar date"""
+        return await self._run(self.scraper.fetch_matches_for_date, target_date, self.parse_pool)
+
+    async def fetch_league_table(self, league_choice: str):
+        """Fetch a league table, trying each of the league's URLs in turn"""
+        return await self._run(self.scraper.fetch_league_table, league_choice, self.parse_pool)
+
+    async def fetch_many(
+        self, dates: List[date], table_choices: List[str] = ()
+    ) -> Tuple[Dict[str, Optional[Dict]], Dict[str, Any]]:
+        """Fetch fixture days and league tables concurrently
+
+        Returns ({date_str: matches or None}, {league_choice: table or None}).
+        """
+        results = await asyncio.gather(
+            *(self.fetch_matches_for_date(day) for day in dates),
+            *(self.fetch_league_table(choice) for choice in table_choices),
+        )
+        by_date = {day.strftime("%Y-%m-%d"): data for day, data in zip(dates, results)}
+        tables = dict(zip(table_choices, results[len(dates):]))
+        return by_date, tables
+
+    async def validate_link(self, url: str, timeout: float = 5) -> bool:
+        """Check if a streaming link is accessible"""
+        return await self._run(self.scraper.stream_searcher.validate_link, url, timeout)
+
+    async def validate_base_site(self, url: str, timeout: float = 5) -> bool:
+        """Check if a base streaming site is accessible"""
+        return await self._run(self.scraper.stream_searcher.validate_base_site, url, timeout)
+
+    async def search_streams(
+        self, home_team: str, away_team: str, league_name: str = ""
+    ) -> List[Dict[str, str]]:
+        """StreamSearcher.search_streams_for_match with the sites probed concurrently"""
+        searcher = self.scraper.stream_searcher
+        search_terms = searcher.search_terms(home_team, away_team)[:4]
+
+        async def first_specific(site: str) -> Optional[Dict[str, str]]:
+            # One site at a time, in the synchronous order, so no site sees a burst
+            for term in search_terms:
+                for url in searcher.candidate_urls(site, term):
+                    if await self.validate_link(url):
+                        return searcher.stream_entry(site, home_team, away_team, "specific", url)
+            return None
+
+        scraped, specific, base_ok = await asyncio.gather(
+            self._run(searcher.scrape_multiple_sites, home_team, away_team, league_name),
+            asyncio.gather(*(first_specific(site) for site in searcher.specific_search_sites())),
+            asyncio.gather(*(self.validate_base_site(site) for site in searcher.streaming_sites)),
+        )
+        working_sites = [site for site, ok in zip(searcher.streaming_sites, base_ok) if ok]
+
+        valid_streams = list(scraped)
+        if len(valid_streams) < 3:
+            valid_streams.extend(entry for entry in specific if entry is not None)
+            valid_streams = valid_streams[:10]
+
+        if not valid_streams:
+            valid_streams.extend(
+                searcher.stream_entry(
+                    site,
+                    home_team,
+                    away_team,
+                    "base",
+                    search_hint=f"Manual search: Look for {home_team} vs {away_team}",
+                )
+                for site in working_sites[:5]
+            )
+
+        for site in working_sites:
+            if len(valid_streams) >= 10:
+                break
+            if any(stream["site"] == stream_site_domain(site) for stream in valid_streams):
+                continue
+            valid_streams.append(
+                searcher.stream_entry(
+                    site,
+                    home_team,
+                    away_team,
+                    "base",
+                    search_hint=f"Manual search needed: {home_team} vs {away_team}",
+                )
+            )
+
+        return searcher.finalize_streams(valid_streams)
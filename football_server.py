@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""
+Headless daemon for the Football Results Scraper
+Polls BBC Sport once per interval and serves the cached results to any number
+of local clients over HTTP, so dashboards share one upstream fetch
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from football_scraper import (
+    METRICS,
+    TABLE_CACHE_TTL,
+    FootballScraper,
+    detect_match_events,
+    match_records,
+    standing_records,
+)
+
+
+def log(message: str):
+    """Daemon log line on stderr (stdout is reserved for parser chatter)"""
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}", file=sys.stderr)
+
+
+class ScoreCache:
+    """Latest fixtures (per date) and tables (per league) shared by all clients
+
+    Each entry carries a version number that bumps on every successful poll;
+    serialised response bodies are memoised per version so concurrent clients
+    asking for the same view reuse one JSON encoding and ETag.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._matches: Dict[str, Dict] = {}
+        self._tables: Dict[str, Dict] = {}
+        self._bodies: Dict[Tuple, Tuple[bytes, str]] = {}
+
+    def _store(self, entries: Dict[str, Dict], key: str, data, stale: bool):
+        previous = entries.get(key)
+        entries[key] = {
+            "version": (previous["version"] + 1) if previous else 1,
+            "data": data,
+            "updated_at": time.time(),
+            "stale": stale,
+        }
+
+    def set_matches(self, date_str: str, data: Dict, stale: bool = False):
+        with self._lock:
+            self._store(self._matches, date_str, data, stale)
+
+    def set_table(self, league_choice: str, data, stale: bool = False):
+        with self._lock:
+            self._store(self._tables, league_choice, data, stale)
+
+    def get_matches(self, date_str: str) -> Optional[Dict]:
+        with self._lock:
+            return self._matches.get(date_str)
+
+    def get_table(self, league_choice: str) -> Optional[Dict]:
+        with self._lock:
+            return self._tables.get(league_choice)
+
+    def body_for(self, memo_key: Tuple, build) -> Tuple[bytes, str]:
+        """Return (body, etag) for a view, building it at most once per version"""
+        with self._lock:
+            cached = self._bodies.get(memo_key)
+        if cached is not None:
+            METRICS.inc("footyres_cache_total", cache="response", result="hit")
+            return cached
+        METRICS.inc("footyres_cache_total", cache="response", result="miss")
+
+        body = json.dumps(build(), ensure_ascii=False).encode("utf-8")
+        etag = f'"{hashlib.sha1(body).hexdigest()[:20]}"'
+        with self._lock:
+            if len(self._bodies) > 512:
+                self._bodies.clear()
+            self._bodies[memo_key] = (body, etag)
+        return body, etag
+
+
+class EventBroker:
+    """Fan-out of match events to SSE and long-poll subscribers
+
+    Events get increasing ids and are kept in a bounded backlog so clients can
+    resume with Last-Event-ID or ?since=; waiting subscribers are woken as soon
+    as the poller publishes. Ids restart at 1 with the daemon, so an id ahead
+    of the last one issued comes from before a restart and replays the backlog.
+    """
+
+    def __init__(self, backlog: int = 1000):
+        self._condition = threading.Condition()
+        self._events = deque(maxlen=backlog)
+        self._last_id = 0
+
+    @property
+    def last_id(self) -> int:
+        with self._condition:
+            return self._last_id
+
+    def publish(self, events: List[Dict]):
+        if not events:
+            return
+        with self._condition:
+            for event in events:
+                self._last_id += 1
+                self._events.append({"id": self._last_id, **event})
+            self._condition.notify_all()
+
+    def resume_from(self, last_id: int) -> int:
+        """last_id, or 0 if no such id has been issued since the daemon started"""
+        with self._condition:
+            return last_id if last_id <= self._last_id else 0
+
+    def since(self, last_id: int, timeout: float = 0) -> List[Dict]:
+        """Events after last_id, waiting up to timeout seconds for the first one"""
+        deadline = time.time() + timeout
+        with self._condition:
+            if last_id > self._last_id:
+                last_id = 0
+            while self._last_id <= last_id:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return []
+                self._condition.wait(remaining)
+            return [event for event in self._events if event["id"] > last_id]
+
+
+class Poller(threading.Thread):
+    """Single polling loop feeding the ScoreCache from fetch_matches/fetch_league_table"""
+
+    def __init__(
+        self,
+        scraper: FootballScraper,
+        cache: ScoreCache,
+        broker: EventBroker,
+        date_offsets: List[int],
+        interval: float = 30,
+        table_interval: float = TABLE_CACHE_TTL,
+    ):
+        super().__init__(daemon=True)
+        self.scraper = scraper
+        self.cache = cache
+        self.broker = broker
+        self.date_offsets = date_offsets
+        self.interval = interval
+        self.table_interval = table_interval
+        self.stop_event = threading.Event()
+        self._next_table_poll = 0.0
+        self._table_polled_at: Dict[str, float] = {}
+
+    def prime_from_snapshots(self):
+        """Serve the last on-disk snapshots (marked stale) until the first poll lands"""
+        for date_offset in self.date_offsets:
+            snapshot = self.scraper.snapshots.load(
+                self.scraper.matches_snapshot_key(date_offset)
+            )
+            if snapshot is not None:
+                self.cache.set_matches(date_for_offset(date_offset), snapshot[1], stale=True)
+
+        for choice in self.scraper.leagues:
+            if choice == "0":
+                continue
+            snapshot = self.scraper.snapshots.load(self.scraper.table_snapshot_key(choice))
+            if snapshot is not None:
+                self.cache.set_table(choice, snapshot[1], stale=True)
+
+    def poll_matches(self):
+        # Every day is fetched concurrently on the async client
+        days = [date.today() + timedelta(days=date_offset) for date_offset in self.date_offsets]
+        fetched, _ = self.scraper.fetch_many(days)
+        for date_str, data in fetched.items():
+            if data is None:
+                log(f"fixtures {date_str}: fetch failed, keeping previous data")
+                continue
+            previous = self.cache.get_matches(date_str)
+            # Diffing against a stale snapshot would replay hours of goals at once
+            if previous is not None and not previous["stale"]:
+                events = detect_match_events(previous["data"], data, date_str)
+                self.broker.publish(events)
+                for event in events:
+                    log(
+                        f"{event['type']}: {event['home_team']} {event['home_score']}-"
+                        f"{event['away_score']} {event['away_team']}"
+                    )
+            self.cache.set_matches(date_str, data)
+            log(f"fixtures {date_str}: {sum(len(m) for m in data.values())} matches")
+
+    def poll_tables(self, force: bool = True):
+        """Fetch every table, or (force=False) only those a result has come in for since"""
+        choices = [choice for choice in self.scraper.leagues if choice != "0"]
+        if not force:
+            choices = [
+                choice
+                for choice in choices
+                if self.scraper.results_changed_at(self.scraper.leagues[choice]["name"])
+                > self._table_polled_at.get(choice, 0)
+            ]
+            if not choices:
+                return
+        polled_at = time.time()
+        _, tables = self.scraper.fetch_many([], choices)
+        for choice in choices:
+            self._table_polled_at[choice] = polled_at
+        for choice, data in tables.items():
+            if not data:
+                log(f"table {self.scraper.leagues[choice]['name']}: fetch failed, keeping previous data")
+                continue
+            self.cache.set_table(choice, data)
+
+    def run(self):
+        while not self.stop_event.is_set():
+            started = time.time()
+            # Parser diagnostics go to stdout; keep them out of the daemon log
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                try:
+                    self.poll_matches()
+                    # Tables change only when results come in; a full refresh every
+                    # table_interval catches anything else
+                    if started >= self._next_table_poll:
+                        self.poll_tables()
+                        self._next_table_poll = started + self.table_interval
+                    else:
+                        self.poll_tables(force=False)
+                except Exception as e:
+                    log(f"poll failed: {e}")
+            self.stop_event.wait(max(0.0, self.interval - (time.time() - started)))
+
+
+def date_for_offset(date_offset: int) -> str:
+    return (datetime.now() + timedelta(days=date_offset)).strftime("%Y-%m-%d")
+
+
+def send_metrics(handler: BaseHTTPRequestHandler):
+    body = METRICS.render().encode("utf-8")
+    handler.send_response(200)
+    handler.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+    handler.send_header("Content-Length", str(len(body)))
+    handler.end_headers()
+    handler.wfile.write(body)
+
+
+def start_metrics_server(host: str = "127.0.0.1", port: int = 9108) -> ThreadingHTTPServer:
+    """Serve /metrics on a background thread (for modes other than --serve)"""
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            if self.path.split("?", 1)[0] == "/metrics":
+                send_metrics(self)
+            else:
+                self.send_error(404)
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_handler(
+    scraper: FootballScraper, cache: ScoreCache, broker: EventBroker, interval: float
+):
+    """Build the request handler class bound to one scraper/cache/broker"""
+
+    class ScoresHandler(BaseHTTPRequestHandler):
+        server_version = "footyres/1"
+
+        def log_message(self, format, *args):
+            pass  # one line per dashboard request would drown the poll log
+
+        def send_json(self, status: int, payload: Dict):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def send_metrics(self):
+            send_metrics(self)
+
+        def send_cached(self, body: bytes, etag: str):
+            if etag in self.headers.get("If-None-Match", ""):
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", f"max-age={int(interval)}")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            parts = [part for part in url.path.split("/") if part]
+
+            if parts == ["matches"]:
+                self.handle_matches(query)
+            elif len(parts) == 2 and parts[0] == "tables":
+                self.handle_table(parts[1])
+            elif parts == ["events"]:
+                self.handle_events(query)
+            elif parts == ["metrics"]:
+                self.send_metrics()
+            elif parts == ["health"]:
+                self.send_json(200, {"status": "ok"})
+            else:
+                self.send_json(404, {"error": "unknown endpoint"})
+
+        def handle_matches(self, query: Dict[str, List[str]]):
+            date_str = query.get("date", [date_for_offset(0)])[0]
+            league_value = query.get("league", [""])[0]
+            league_name = None
+            if league_value:
+                choice = scraper.resolve_league_choice(league_value)
+                if choice is None:
+                    self.send_json(404, {"error": f"unknown league: {league_value}"})
+                    return
+                if choice != "0":
+                    league_name = scraper.leagues[choice]["name"]
+
+            entry = cache.get_matches(date_str)
+            if entry is None:
+                self.send_json(404, {"error": f"no data for {date_str}"})
+                return
+
+            def build():
+                return {
+                    "date": date_str,
+                    "league": league_name,
+                    "updated_at": entry["updated_at"],
+                    "stale": entry["stale"],
+                    "matches": match_records(
+                        entry["data"],
+                        date_str,
+                        [league_name] if league_name else None,
+                    ),
+                }
+
+            body, etag = cache.body_for(
+                ("matches", date_str, league_name, entry["version"]), build
+            )
+            self.send_cached(body, etag)
+
+        def handle_table(self, league_value: str):
+            choice = scraper.resolve_league_choice(league_value)
+            if choice is None or choice == "0":
+                self.send_json(404, {"error": f"unknown league: {league_value}"})
+                return
+
+            entry = cache.get_table(choice)
+            if entry is None:
+                self.send_json(503, {"error": "table not fetched yet"})
+                return
+
+            league_name = scraper.leagues[choice]["name"]
+
+            def build():
+                return {
+                    "league": league_name,
+                    "updated_at": entry["updated_at"],
+                    "stale": entry["stale"],
+                    "standings": standing_records(league_name, entry["data"]),
+                }
+
+            body, etag = cache.body_for(("table", choice, entry["version"]), build)
+            self.send_cached(body, etag)
+
+        def handle_events(self, query: Dict[str, List[str]]):
+            league_name = None
+            if query.get("league"):
+                choice = scraper.resolve_league_choice(query["league"][0])
+                if choice is None:
+                    self.send_json(404, {"error": f"unknown league: {query['league'][0]}"})
+                    return
+                if choice != "0":
+                    league_name = scraper.leagues[choice]["name"]
+
+            def wanted(events):
+                return [e for e in events if league_name is None or e["league"] == league_name]
+
+            if "since" in query:
+                # Long-poll: block until something newer than ?since= arrives
+                try:
+                    last_id = int(query["since"][0])
+                    timeout = min(float(query.get("timeout", ["25"])[0]), 60)
+                except ValueError:
+                    self.send_json(400, {"error": "since and timeout must be numbers"})
+                    return
+                last_id = broker.resume_from(last_id)
+                deadline = time.time() + timeout
+                events = []
+                while not events and time.time() < deadline:
+                    batch = broker.since(last_id, deadline - time.time())
+                    if not batch:
+                        break
+                    last_id = batch[-1]["id"]
+                    events = wanted(batch)
+                self.send_json(200, {"last_id": last_id, "events": events})
+                return
+
+            try:
+                last_id = int(self.headers.get("Last-Event-ID") or broker.last_id)
+            except ValueError:
+                last_id = broker.last_id
+            last_id = broker.resume_from(last_id)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            try:
+                self.wfile.write(b"retry: 3000\n\n")
+                self.wfile.flush()
+                while True:
+                    batch = broker.since(last_id, timeout=15)
+                    if not batch:
+                        self.wfile.write(b": keepalive\n\n")
+                    for event in wanted(batch):
+                        data = json.dumps(event, ensure_ascii=False)
+                        self.wfile.write(
+                            f"id: {event['id']}\nevent: {event['type']}\ndata: {data}\n\n".encode("utf-8")
+                        )
+                    if batch:
+                        last_id = batch[-1]["id"]
+                    self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # subscriber went away
+
+    return ScoresHandler
+
+
+def serve(
+    scraper: FootballScraper,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    interval: float = 30,
+    table_interval: float = TABLE_CACHE_TTL,
+    date_offsets: Optional[List[int]] = None,
+) -> int:
+    """Run the polling loop and HTTP API until interrupted"""
+    cache = ScoreCache()
+    broker = EventBroker()
+    poller = Poller(scraper, cache, broker, date_offsets or [0], interval, table_interval)
+    poller.prime_from_snapshots()
+
+    server = ThreadingHTTPServer((host, port), make_handler(scraper, cache, broker, interval))
+    server.daemon_threads = True
+    poller.start()
+    log(f"Serving on http://{host}:{server.server_port} (poll every {interval:g}s)")
+    log("Endpoints: /matches?date=YYYY-MM-DD&league=pl  /tables/{league}  /events  /metrics  /health")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        log("Shutting down")
+    finally:
+        poller.stop_event.set()
+        server.server_close()
+    return 0
@@ -0,0 +1,640 @@
+#!/usr/bin/env python3
+"""
+League standings computed locally from match results
+
+StandingsEngine keeps per-team aggregates (P/W/D/L/GF/GA/Pts and form) for a
+league and folds in each finished result exactly once, so updating it after a
+fixtures fetch costs O(matches changed) and a table view needs no page of its
+own. Live scores can be overlaid for an "as it stands" table without touching
+the stored aggregates.
+
+Usage:
+  book = StandingsBook()
+  book.update("2025-08-16", scraper.fetch_matches_for_date(date(2025, 8, 16)))
+  rows = book.engine("Premier League").table()
+"""
+
+import bisect
+import copy
+import itertools
+import threading
+from datetime import date, timedelta
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from football_scraper import (
+    FINISHED_STATUSES,
+    NOT_STARTED_STATUSES,
+    normalize_team_name,
+    reference_data,
+)
+from football_stats import SeasonStore
+
+FORM_LENGTH = 5
+
+# Leagues whose season runs January to December; the rest start in the summer
+CALENDAR_YEAR_LEAGUES = ("MLS", "Allsvenskan")
+
+MatchKey = Tuple[str, str, str]
+
+
+def season_start(league_name: str, today: Optional[date] = None) -> date:
+    """First day of the league's current season"""
+    today = today or date.today()
+    if league_name in CALENDAR_YEAR_LEAGUES:
+        return date(today.year, 1, 1)
+    return date(today.year if today.month >= 7 else today.year - 1, 7, 1)
+
+
+def goals(score) -> Optional[int]:
+    try:
+        return int(score)
+    except (TypeError, ValueError):
+        return None
+
+
+def is_live(match: Dict) -> bool:
+    """True for matches in progress (a minute, HT, ET, LIVE...)"""
+    status = match.get("status") or ""
+    return status not in FINISHED_STATUSES and status not in NOT_STARTED_STATUSES
+
+
+def counts_for_table(match: Dict) -> bool:
+    """Two-legged ties are knockout games and never enter a league table"""
+    return not match.get("is_multi_leg") and bool(match.get("home_team")) and bool(match.get("away_team"))
+
+
+class TeamRecord:
+    """Running totals for one team in one league"""
+
+    __slots__ = ("team", "played", "won", "drawn", "lost", "goals_for", "goals_against")
+
+    def __init__(self, team: str):
+        self.team = team
+        self.played = self.won = self.drawn = self.lost = 0
+        self.goals_for = self.goals_against = 0
+
+    @property
+    def points(self) -> int:
+        return self.won * 3 + self.drawn
+
+    @property
+    def goal_difference(self) -> int:
+        return self.goals_for - self.goals_against
+
+    def add(self, scored: int, conceded: int, sign: int = 1):
+        """Count (sign=1) or uncount (sign=-1) one result"""
+        self.played += sign
+        self.goals_for += sign * scored
+        self.goals_against += sign * conceded
+        if scored > conceded:
+            self.won += sign
+        elif scored < conceded:
+            self.lost += sign
+        else:
+            self.drawn += sign
+
+    def row(self) -> Dict:
+        return {
+            "team": self.team,
+            "played": self.played,
+            "won": self.won,
+            "drawn": self.drawn,
+            "lost": self.lost,
+            "goals_for": self.goals_for,
+            "goals_against": self.goals_against,
+            "goal_difference": self.goal_difference,
+            "points": self.points,
+        }
+
+
+def result_letter(scored: int, conceded: int) -> str:
+    return "W" if scored > conceded else ("L" if scored < conceded else "D")
+
+
+class HistoryEntry(NamedTuple):
+    """One finished match from one team's side"""
+
+    date: str
+    kickoff: str
+    league: str
+    opponent: str
+    venue: str  # "H" or "A"
+    scored: int
+    conceded: int
+    result: str  # "W", "D" or "L"
+
+
+class Meeting(NamedTuple):
+    """One finished match between two teams, as played"""
+
+    date: str
+    kickoff: str
+    league: str
+    home: str
+    away: str
+    home_goals: int
+    away_goals: int
+
+
+def pair_key(team: str, other: str) -> Tuple[str, str]:
+    return (team, other) if team <= other else (other, team)
+
+
+class MatchHistory:
+    """Finished matches indexed by team and by pair of teams, sorted by date
+
+    Each team's games and each pair's meetings are kept sorted, so a date
+    range is two bisects away. Form over all competitions and in each league
+    is recomputed for just the two teams involved whenever a result is added
+    or removed, so form() is a dict lookup however long the history grows.
+    Only the meetings are pickled; the other indexes are rebuilt on load.
+    """
+
+    def __init__(self):
+        self.by_team: Dict[str, List[HistoryEntry]] = {}
+        self.by_pair: Dict[Tuple[str, str], List[Meeting]] = {}
+        # (team, league or None for all competitions) -> last FORM_LENGTH results, oldest first
+        self._form: Dict[Tuple[str, Optional[str]], str] = {}
+
+    def __getstate__(self):
+        return {"meetings": [meeting for meetings in self.by_pair.values() for meeting in meetings]}
+
+    def __setstate__(self, state):
+        self.__init__()
+        for meeting in sorted(state["meetings"]):
+            self._index(meeting)
+        for team, league in {(team, game.league) for team, games in self.by_team.items() for game in games}:
+            self._refresh(team, league)
+
+    def add(self, date_str: str, kickoff: str, league: str, home: str, away: str, home_goals: int, away_goals: int):
+        meeting = Meeting(date_str, kickoff, league, home, away, home_goals, away_goals)
+        self._index(meeting)
+        self._refresh(home, league)
+        self._refresh(away, league)
+
+    def remove(self, date_str: str, kickoff: str, league: str, home: str, away: str, home_goals: int, away_goals: int):
+        meeting = Meeting(date_str, kickoff, league, home, away, home_goals, away_goals)
+        if not _discard(self.by_pair.get(pair_key(home, away), []), meeting):
+            return
+        for team, entry in self._entries(meeting):
+            _discard(self.by_team.get(team, []), entry)
+            self._refresh(team, league)
+
+    def _index(self, meeting: Meeting):
+        bisect.insort(self.by_pair.setdefault(pair_key(meeting.home, meeting.away), []), meeting)
+        for team, entry in self._entries(meeting):
+            bisect.insort(self.by_team.setdefault(team, []), entry)
+
+    @staticmethod
+    def _entries(meeting: Meeting):
+        date_str, kickoff, league, home, away, home_goals, away_goals = meeting
+        return (
+            (home, HistoryEntry(date_str, kickoff, league, away, "H", home_goals, away_goals, result_letter(home_goals, away_goals))),
+            (away, HistoryEntry(date_str, kickoff, league, home, "A", away_goals, home_goals, result_letter(away_goals, home_goals))),
+        )
+
+    def _refresh(self, team: str, league: str):
+        games = self.by_team.get(team, [])
+        self._form[(team, None)] = "".join(game.result for game in games[-FORM_LENGTH:])
+        recent = []
+        for game in reversed(games):
+            if game.league == league:
+                recent.append(game.result)
+                if len(recent) == FORM_LENGTH:
+                    break
+        self._form[(team, league)] = "".join(reversed(recent))
+
+    def form(self, team: str, league: Optional[str] = None) -> str:
+        """Last FORM_LENGTH results ("WDLWW", oldest first) in a league, or in all of them"""
+        return self._form.get((team, league), "")
+
+    def games(self, team: str, start: Optional[str] = None, end: Optional[str] = None) -> List[HistoryEntry]:
+        """A team's games from start to end (inclusive ISO dates), oldest first"""
+        return _date_slice(self.by_team.get(team, []), start, end)
+
+    def meetings(self, team: str, other: str, start: Optional[str] = None, end: Optional[str] = None) -> List[Meeting]:
+        """Every game between two teams from start to end, oldest first"""
+        return _date_slice(self.by_pair.get(pair_key(team, other), []), start, end)
+
+    def teams(self) -> List[str]:
+        return [team for team, games in self.by_team.items() if games]
+
+
+def _discard(items: List, item) -> bool:
+    """Remove item from a sorted list; False if it wasn't there"""
+    index = bisect.bisect_left(items, item)
+    if index < len(items) and items[index] == item:
+        del items[index]
+        return True
+    return False
+
+
+def _date_slice(items: List, start: Optional[str], end: Optional[str]) -> List:
+    """The entries of a date-sorted list from start to end (inclusive ISO dates)"""
+    low = bisect.bisect_left(items, (start,)) if start else 0
+    high = bisect.bisect_left(items, (end + "~",)) if end else len(items)
+    return items[low:high]
+
+
+# What separates teams level on points, in order, for each league. "head_to_head"
+# is a mini-league of the tied teams' games against each other (points, then
+# goal difference, then goals), used only when those results are known.
+TIE_BREAKERS = {
+    "Premier League": ("goal_difference", "goals_for", "head_to_head"),
+    "La Liga": ("head_to_head", "goal_difference", "goals_for"),
+    "Bundesliga": ("goal_difference", "goals_for", "head_to_head"),
+    "Serie A": ("head_to_head", "goal_difference", "goals_for"),
+    "Ligue 1": ("goal_difference", "head_to_head", "goals_for"),
+    "Primeira Liga": ("head_to_head", "goal_difference", "goals_for"),
+    "UEFA Champions League": ("goal_difference", "goals_for", "won"),
+    "MLS": ("won", "goal_difference", "goals_for"),
+    "Allsvenskan": ("goal_difference", "goals_for"),
+}
+DEFAULT_TIE_BREAKERS = ("goal_difference", "goals_for")
+
+# (home, away, home_goals, away_goals)
+Result = Tuple[str, str, int, int]
+
+
+def head_to_head(teams: Set[str], results: List[Result]) -> Dict[str, Tuple[int, int, int]]:
+    """(points, goal difference, goals) per team from games among teams only"""
+    table = {team: [0, 0, 0] for team in teams}
+    for home, away, home_goals, away_goals in results:
+        if home in teams and away in teams:
+            for team, scored, conceded in ((home, home_goals, away_goals), (away, away_goals, home_goals)):
+                entry = table[team]
+                entry[0] += 3 if scored > conceded else (1 if scored == conceded else 0)
+                entry[1] += scored - conceded
+                entry[2] += scored
+    return {team: tuple(entry) for team, entry in table.items()}
+
+
+def rank_rows(rows: List[Dict], league_name: str, results: Iterable[Result] = ()) -> List[Dict]:
+    """Sort table rows with the league's tie-breakers and renumber their positions
+
+    Rows are ordered by points, then each tie-breaker in turn, only ever
+    splitting groups that are still level, so a typical table costs one sort.
+    results (materialised only if head-to-head is reached) supplies the games
+    for head-to-head; teams still level after every rule are ordered by name.
+    """
+    criteria = ("points",) + TIE_BREAKERS.get(league_name, DEFAULT_TIE_BREAKERS)
+    known_results: Optional[List[Result]] = None
+
+    def order(group: List[Dict], level: int) -> List[Dict]:
+        nonlocal known_results
+        if len(group) < 2 or level == len(criteria):
+            return sorted(group, key=lambda row: row.get("team", ""))
+        criterion = criteria[level]
+        if criterion == "head_to_head":
+            if known_results is None:
+                known_results = list(results)
+            mini = head_to_head({row.get("team") for row in group}, known_results)
+
+            def key(row):
+                return mini[row.get("team")]
+
+        else:
+
+            def key(row):
+                return row.get(criterion) or 0
+
+        ordered = []
+        group = sorted(group, key=key, reverse=True)
+        start = 0
+        for end in range(1, len(group) + 1):
+            if end == len(group) or key(group[end]) != key(group[start]):
+                ordered.extend(order(group[start:end], level + 1))
+                start = end
+        return ordered
+
+    ranked = order(list(rows), 0)
+    for position, row in enumerate(ranked, 1):
+        row["position"] = position
+    return ranked
+
+
+def live_results(live: Iterable[Dict]) -> List[Result]:
+    """Current scores of the in-progress league games in live"""
+    scores = []
+    for match in live:
+        if is_live(match) and counts_for_table(match):
+            home_goals, away_goals = goals(match.get("home_score")), goals(match.get("away_score"))
+            if home_goals is not None and away_goals is not None:
+                scores.append((match["home_team"], match["away_team"], home_goals, away_goals))
+    return scores
+
+
+def find_row(rows_by_name: Dict[str, Dict], team: str) -> Optional[Dict]:
+    """Table row for a fixtures team name: same name in any case, else the row
+    that is one of the same club's known names ("Man Utd": "Manchester United")
+
+    Names are never matched by substring: "Milan" must not find "Inter Milan".
+    """
+    row = rows_by_name.get(team.lower())
+    if row is not None:
+        return row
+    index = reference_data().team_index
+    match = index.lookup(team)
+    if match is None:
+        return None
+    names = index.aliases.get(match.team, ())
+    for name, candidate in rows_by_name.items():
+        if normalize_team_name(name) in names:
+            return candidate
+    return None
+
+
+def project_table(
+    rows: List[Dict], live: Iterable[Dict], league_name: str, results: Iterable[Result] = ()
+) -> List[Dict]:
+    """The published table as it stands with in-progress scores counted as results
+
+    Rows are copied, so the published table is left untouched. Each projected
+    row gets "movement" (places gained on its published position) and "live"
+    (True while its team is playing). results feeds head-to-head tie-breakers;
+    the live scores themselves are added to it. Costs O(teams log teams).
+    """
+    projected = [dict(row, movement=0, live=False) for row in rows]
+    published = {id(row): row.get("position") or index for index, row in enumerate(projected, 1)}
+    rows_by_name = {(row.get("team") or "").lower(): row for row in projected}
+
+    scores = live_results(live)
+    for home, away, home_goals, away_goals in scores:
+        home_row, away_row = find_row(rows_by_name, home), find_row(rows_by_name, away)
+        if home_row is None or away_row is None:
+            continue
+        for row, scored, conceded in ((home_row, home_goals, away_goals), (away_row, away_goals, home_goals)):
+            row["played"] = (row.get("played") or 0) + 1
+            outcome = "won" if scored > conceded else ("lost" if scored < conceded else "drawn")
+            row[outcome] = (row.get(outcome) or 0) + 1
+            row["goals_for"] = (row.get("goals_for") or 0) + scored
+            row["goals_against"] = (row.get("goals_against") or 0) + conceded
+            row["goal_difference"] = (row.get("goal_difference") or 0) + scored - conceded
+            row["points"] = (row.get("points") or 0) + (3 if outcome == "won" else (1 if outcome == "drawn" else 0))
+            row["live"] = True
+
+    ranked = rank_rows(projected, league_name, itertools.chain(scores, results))
+    for row in ranked:
+        row["movement"] = published[id(row)] - row["position"]
+    return ranked
+
+
+class StandingsEngine:
+    """Standings for one league, updated one finished result at a time
+
+    Results from earlier seasons are kept for the match history but only the
+    current season's are counted in the table.
+    """
+
+    # First day (ISO) of the season the table counts; "" until the first roll_season()
+    season = ""
+
+    def __init__(self, league_name: str, history: Optional[MatchHistory] = None):
+        self.league_name = league_name
+        self.teams: Dict[str, TeamRecord] = {}
+        # (date_str, home, away) -> (home_goals, away_goals, kickoff) of every finished result
+        self.results: Dict[MatchKey, Tuple[int, int, str]] = {}
+        # Shared by every league in a StandingsBook, for form across competitions
+        self.history = history if history is not None else MatchHistory()
+        self.roll_season()
+
+    def roll_season(self):
+        """Start counting a new season's table once the league's season has turned over"""
+        season = season_start(self.league_name).isoformat()
+        if season == self.season:
+            return
+        self.season = season
+        self.teams = {}
+        for (date_str, home, away), (home_goals, away_goals, _) in self.results.items():
+            if date_str >= season:
+                self.record(home).add(home_goals, away_goals, 1)
+                self.record(away).add(away_goals, home_goals, 1)
+
+    def record(self, team: str) -> TeamRecord:
+        record = self.teams.get(team)
+        if record is None:
+            record = self.teams[team] = TeamRecord(team)
+        return record
+
+    def _count(self, key: MatchKey, score: Tuple[int, int, str], sign: int):
+        date_str, home, away = key
+        home_goals, away_goals, kickoff = score
+        if date_str >= self.season:
+            self.record(home).add(home_goals, away_goals, sign)
+            self.record(away).add(away_goals, home_goals, sign)
+        record = self.history.add if sign > 0 else self.history.remove
+        record(date_str, kickoff, self.league_name, home, away, home_goals, away_goals)
+
+    def apply(self, date_str: str, match: Dict) -> bool:
+        """Fold one match into the table; True if the standings changed
+
+        Finished results are counted once per (date, home, away); a corrected
+        score replaces the old one, and a result that is no longer final
+        (e.g. an abandoned match) is taken back out.
+        """
+        if not counts_for_table(match):
+            return False
+        key = (date_str, match["home_team"], match["away_team"])
+        previous = self.results.get(key)
+        score = None
+        if match.get("status") in FINISHED_STATUSES:
+            home_goals, away_goals = goals(match.get("home_score")), goals(match.get("away_score"))
+            if home_goals is not None and away_goals is not None:
+                score = (home_goals, away_goals, match.get("time") or "")
+        if score == previous:
+            return False
+
+        if previous is not None:
+            self._count(key, previous, -1)
+            del self.results[key]
+        if score is not None:
+            self._count(key, score, 1)
+            self.results[key] = score
+        return True
+
+    def update(self, date_str: str, matches: Iterable[Dict]) -> int:
+        """Apply a day's matches for this league; returns how many changed the table"""
+        self.roll_season()
+        return sum(self.apply(date_str, match) for match in matches)
+
+    def iter_results(self) -> Iterator[Result]:
+        """This season's results, for head-to-head tie-breakers"""
+        return (
+            (home, away, score[0], score[1])
+            for (date_str, home, away), score in self.results.items()
+            if date_str >= self.season
+        )
+
+    def table(self, live: Iterable[Dict] = ()) -> List[Dict]:
+        """Rows in table order, projected with in-progress scores from live if any
+
+        The stored aggregates are never touched by live scores; see project_table.
+        """
+        self.roll_season()
+        rows = []
+        for record in self.teams.values():
+            row = record.row()
+            row["form"] = list(self.history.form(record.team, self.league_name))
+            rows.append(row)
+        rows = rank_rows(rows, self.league_name, self.iter_results())
+        live = list(live)
+        if live_results(live):
+            rows = project_table(rows, live, self.league_name, self.iter_results())
+        return rows
+
+
+class StandingsBook:
+    """A StandingsEngine per league, fed with whole fetch_matches() results
+
+    Thread-safe, and picklable so it can live in the snapshot cache. Days
+    recorded in settled were final when applied and need no refetch: every
+    match finished or postponed, or the day at least two days past. One
+    MatchHistory is shared by every engine, so form spans competitions, and
+    every result also goes into a columnar SeasonStore for statistics.
+    """
+
+    def __init__(self):
+        self.engines: Dict[str, StandingsEngine] = {}
+        self.history = MatchHistory()
+        self.stats = SeasonStore()
+        self.settled: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        with self._lock:
+            # Copied under the lock so a concurrent update can't change them mid-pickle;
+            # one deepcopy keeps the engines sharing the copied history
+            engines, history = copy.deepcopy((self.engines, self.history))
+            return {
+                "engines": engines,
+                "history": history,
+                "stats": copy.deepcopy(self.stats),
+                "settled": set(self.settled),
+            }
+
+    def __setstate__(self, state):
+        self.engines = state["engines"]
+        self.history = state["history"]
+        self.settled = state["settled"]
+        self.stats = state.get("stats")
+        if self.stats is None:
+            # Saved before statistics were kept: feed every day through again
+            self.stats = SeasonStore()
+            self.settled = set()
+        self._lock = threading.Lock()
+
+    def engine(self, league_name: str) -> StandingsEngine:
+        with self._lock:
+            engine = self.engines.get(league_name)
+            if engine is None:
+                engine = self.engines[league_name] = StandingsEngine(league_name, self.history)
+            return engine
+
+    def update(self, date_str: str, matches_by_league: Optional[Dict]) -> int:
+        """Apply one day's matches by league; returns how many changed a table"""
+        if matches_by_league is None:
+            return 0
+        changed = 0
+        today = date.today()
+        # Days before yesterday can't change any more
+        recent = date_str >= (today - timedelta(days=1)).isoformat()
+        with self._lock:
+            for league_name, matches in matches_by_league.items():
+                engine = self.engines.get(league_name)
+                if engine is None:
+                    engine = self.engines[league_name] = StandingsEngine(league_name, self.history)
+                changed += engine.update(date_str, matches)
+                for match in matches:
+                    self.stats.apply(date_str, league_name, match)
+            if not recent or (
+                date_str < today.isoformat()
+                and all(
+                    match.get("status") in FINISHED_STATUSES + ("POSTPONED",)
+                    for matches in matches_by_league.values()
+                    for match in matches
+                )
+            ):
+                self.settled.add(date_str)
+        return changed
+
+    def covers(self, start: date, end: date) -> bool:
+        """True if every day from start to end was complete when applied"""
+        return self.first_unsettled(start, end) is None
+
+    def first_unsettled(self, start: date, end: date) -> Optional[date]:
+        """Earliest day from start to end that still has to be fetched, if any"""
+        day = start
+        while day <= end:
+            if day.isoformat() not in self.settled:
+                return day
+            day += timedelta(days=1)
+        return None
+
+    def results(self, league_name: str) -> List[Result]:
+        """Every counted result in a league, for head-to-head tie-breakers"""
+        with self._lock:
+            engine = self.engines.get(league_name)
+            return list(engine.iter_results()) if engine is not None else []
+
+    def form(self, team: str, league_name: Optional[str] = None) -> str:
+        """A team's recent results ("WDLWW", oldest first) in a league, or in all of them
+
+        A name the book has no games for (a table's "Man Utd" for the fixtures'
+        "Manchester United") is resolved with find_team first.
+        """
+        with self._lock:
+            if self.history.by_team.get(team):
+                return self.history.form(team, league_name)
+        stored = self.find_team(team)
+        if stored is None:
+            return ""
+        with self._lock:
+            return self.history.form(stored, league_name)
+
+    def games(self, team: str, start: Optional[str] = None, end: Optional[str] = None) -> List[HistoryEntry]:
+        """A team's finished games in every league between two ISO dates, oldest first"""
+        with self._lock:
+            return self.history.games(team, start, end)
+
+    def meetings(self, team: str, other: str) -> List[Meeting]:
+        """Every finished game between two teams, oldest first"""
+        with self._lock:
+            return self.history.meetings(team, other)
+
+    def find_team(self, name: str) -> Optional[str]:
+        """The stored team a typed name refers to, or None if unknown or ambiguous
+
+        An exact name in any case wins; otherwise the name is resolved through
+        the reference TeamIndex and matched against that club's known names.
+        Never by substring: "Rangers" must not find "Queens Park Rangers".
+        """
+        wanted = name.strip().lower()
+        if not wanted:
+            return None
+        with self._lock:
+            teams = {team: len(self.history.by_team[team]) for team in self.history.teams()}
+        for team in teams:
+            if team.lower() == wanted:
+                return team
+
+        index = reference_data().team_index
+        matches = index.search(name, 2)
+        if not matches or (len(matches) > 1 and matches[1].score == matches[0].score):
+            return None
+        names = index.aliases.get(matches[0].team, ())
+        # Several stored spellings of one club: the one with most games
+        candidates = [team for team in teams if normalize_team_name(team) in names]
+        return max(candidates, key=teams.get) if candidates else None
+
+    def season_stats(self, league_name: str, start: Optional[str] = None) -> Dict:
+        """Season summary for a league from start (ISO date), with its scoring streak leaders"""
+        with self._lock:
+            rows = self.stats.rows(league_name, start)
+            summary = dict(league=league_name, **self.stats.summary(rows))
+            summary["streaks"] = [streak._asdict() for streak in self.stats.scoring_streaks(rows)]
+            return summary
+
+    def table(self, league_name: str, live: Iterable[Dict] = ()) -> List[Dict]:
+        with self._lock:
+            engine = self.engines.get(league_name)
+            return engine.table(live) if engine is not None else []
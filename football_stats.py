@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Columnar store of finished matches and goals for season statistics
+
+Every finished match is one row across parallel array.array columns (day,
+league, teams, score) and every goal one row of (minute, side), with
+team and league names interned as small integers. A season of every league
+is a few hundred KB, and aggregates run as column passes (map, compress, sum,
+bytes.translate) in C rather than as Python loops over match dicts.
+
+Usage:
+  store = SeasonStore()
+  store.apply("2025-08-16", "Premier League", match)
+  rows = store.rows("Premier League", start="2025-07-01")
+  summary, streaks = store.summary(rows), store.scoring_streaks(rows)
+"""
+
+import itertools
+import operator
+import re
+from array import array
+from datetime import date
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from football_scraper import FINISHED_STATUSES
+
+# 15-minute buckets; stoppage time counts in the half it was added to
+MINUTE_BUCKETS = ("1-15", "16-30", "31-45", "46-60", "61-75", "76-90")
+_BUCKET_OF_MINUTE = bytes(min(max(minute - 1, 0) // 15, 5) for minute in range(256))
+GOAL_MINUTE = re.compile(r"(\d+)(?:\+\d+)?'")
+STREAK_LEADERS = 5
+
+
+class Streak(NamedTuple):
+    team: str
+    league: str
+    current: int  # Consecutive matches scored in, up to the latest
+    longest: int
+
+
+def goal_minutes(scorers: List[str]) -> List[int]:
+    """Minutes of the goals in scorer strings like "⚽ Saka 45+2' (pen)" (45)"""
+    minutes = []
+    for scorer in scorers or []:
+        minutes.extend(min(int(minute), 255) for minute in GOAL_MINUTE.findall(scorer))
+    return minutes
+
+
+class SeasonStore:
+    """Finished matches and their goals as columns, updated one result at a time
+
+    A match's goals are appended right after it, so goal_start/goal_count
+    find them without a scan, and each league keeps the numbers of its rows
+    so a league query never touches the others. A corrected or retracted
+    result is masked out of the active column and the corrected one
+    appended; rows never move.
+    """
+
+    def __init__(self):
+        self.teams: List[str] = []
+        self.leagues: List[str] = []
+        self._team_ids: Dict[str, int] = {}
+        self._league_ids: Dict[str, int] = {}
+
+        # One entry per match row
+        self.day = array("l")  # date ordinal
+        self.league = array("H")
+        self.home = array("l")
+        self.away = array("l")
+        self.home_goals = array("B")
+        self.away_goals = array("B")
+        self.active = array("B")
+        self.goal_start = array("l")
+        self.goal_count = array("B")
+        # One entry per goal row
+        self.goal_minute = array("B")
+        self.goal_away = array("B")  # 0 home, 1 away
+
+        # League id -> its match rows
+        self._league_rows: Dict[int, array] = {}
+        # (date_str, home, away) -> (row, hash of the score and goal minutes it was stored with);
+        # a tuple of ints hashes the same in every process
+        self._rows: Dict[Tuple[str, str, str], Tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _intern(self, name: str, names: List[str], ids: Dict[str, int]) -> int:
+        index = ids.get(name)
+        if index is None:
+            index = ids[name] = len(names)
+            names.append(name)
+        return index
+
+    def apply(self, date_str: str, league_name: str, match: Dict) -> bool:
+        """Store a finished match, or correct/retract a stored one; True if anything changed"""
+        home, away = match.get("home_team"), match.get("away_team")
+        if not home or not away:
+            return False
+        key = (date_str, home, away)
+        stored = self._rows.get(key)
+
+        signature = None
+        if match.get("status") in FINISHED_STATUSES:
+            try:
+                home_goals, away_goals = int(match.get("home_score")), int(match.get("away_score"))
+            except (TypeError, ValueError):
+                pass
+            else:
+                # Minutes sorted: scorer lists stored before they were in page order
+                # must not make an unchanged result look like a correction
+                signature = (
+                    min(home_goals, 255),
+                    min(away_goals, 255),
+                    tuple(sorted(goal_minutes(match.get("home_scorers")))),
+                    tuple(sorted(goal_minutes(match.get("away_scorers")))),
+                )
+        if (signature and hash(signature)) == (stored[1] if stored else None):
+            return False
+
+        if stored is not None:
+            self.active[stored[0]] = 0
+            del self._rows[key]
+        if signature is not None:
+            row = len(self.day)
+            league_id = self._intern(league_name, self.leagues, self._league_ids)
+            self.day.append(date.fromisoformat(date_str).toordinal())
+            self.league.append(league_id)
+            self.home.append(self._intern(home, self.teams, self._team_ids))
+            self.away.append(self._intern(away, self.teams, self._team_ids))
+            self.home_goals.append(signature[0])
+            self.away_goals.append(signature[1])
+            self.active.append(1)
+            self.goal_start.append(len(self.goal_minute))
+            for side, minutes in enumerate(signature[2:]):
+                self.goal_minute.extend(minutes)
+                self.goal_away.extend(bytes([side]) * len(minutes))
+            self.goal_count.append(min(len(self.goal_minute) - self.goal_start[row], 255))
+            self._league_rows.setdefault(league_id, array("l")).append(row)
+            self._rows[key] = (row, hash(signature))
+        return True
+
+    def rows(self, league_name: Optional[str] = None, start: Optional[str] = None, end: Optional[str] = None) -> array:
+        """Numbers of the active match rows in a league (default all) between two ISO dates"""
+        if league_name is None:
+            candidates = array("l", range(len(self.day)))
+        else:
+            candidates = self._league_rows.get(self._league_ids.get(league_name), array("l"))
+        keep = map(self.active.__getitem__, candidates)
+        if start is not None or end is not None:
+            first = date.fromisoformat(start).toordinal() if start else 0
+            last = date.fromisoformat(end).toordinal() if end else date.max.toordinal()
+            days = map(self.day.__getitem__, candidates)
+            keep = map(operator.and_, keep, map(range(first, last + 1).__contains__, days))
+        return array("l", itertools.compress(candidates, keep))
+
+    def summary(self, rows: array) -> Dict:
+        """Goals, results split, home/away scoring and goal timing over match rows"""
+        home_goals = array("B", map(self.home_goals.__getitem__, rows))
+        away_goals = array("B", map(self.away_goals.__getitem__, rows))
+        matches = len(rows)
+        home_wins = sum(map(operator.gt, home_goals, away_goals))
+        away_wins = sum(map(operator.lt, home_goals, away_goals))
+        both_scored = sum(map(operator.and_, map(bool, home_goals), map(bool, away_goals)))
+
+        minutes = self.goal_minute.tobytes()
+        starts, counts = self.goal_start, self.goal_count
+        buckets = b"".join(
+            minutes[starts[row] : starts[row] + counts[row]] for row in rows
+        ).translate(_BUCKET_OF_MINUTE)
+        timed_goals = len(buckets)
+
+        def share(count: int, total: int) -> float:
+            return round(100 * count / total, 1) if total else 0.0
+
+        total_home, total_away = sum(home_goals), sum(away_goals)
+        return {
+            "matches": matches,
+            "goals": total_home + total_away,
+            "goals_per_match": round((total_home + total_away) / matches, 2) if matches else 0.0,
+            "home_goals_per_match": round(total_home / matches, 2) if matches else 0.0,
+            "away_goals_per_match": round(total_away / matches, 2) if matches else 0.0,
+            "home_win_pct": share(home_wins, matches),
+            "draw_pct": share(matches - home_wins - away_wins, matches),
+            "away_win_pct": share(away_wins, matches),
+            "both_scored_pct": share(both_scored, matches),
+            "goals_by_minute": {
+                label: share(buckets.count(bucket), timed_goals) for bucket, label in enumerate(MINUTE_BUCKETS)
+            },
+        }
+
+    def scoring_streaks(self, rows: array, limit: int = STREAK_LEADERS) -> List[Streak]:
+        """Teams on the longest current runs of matches scored in over match rows, with their longest run"""
+        current: Dict[int, int] = {}
+        longest: Dict[int, int] = {}
+        last_league: Dict[int, int] = {}
+        for row in sorted(rows, key=self.day.__getitem__):
+            for team, scored in ((self.home[row], self.home_goals[row]), (self.away[row], self.away_goals[row])):
+                run = current[team] = current.get(team, 0) + 1 if scored else 0
+                if run > longest.get(team, 0):
+                    longest[team] = run
+                last_league[team] = self.league[row]
+        leaders = sorted(current, key=lambda team: (-current[team], -longest.get(team, 0), self.teams[team]))
+        return [
+            Streak(self.teams[team], self.leagues[last_league[team]], current[team], longest.get(team, 0))
+            for team in leaders[:limit]
+        ]
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Record and replay the scraper's HTTP traffic for deterministic runs
+
+RecordingAdapter passes requests through to the network and appends each
+request/response pair to an HttpArchive; ReplayAdapter answers from the
+archive with no network access, sleeping for the recorded response time
+divided by a speed factor (0 = no delay). Archives are HAR-style JSON,
+gzip-compressed, so a real match day can be captured once and then profiled,
+benchmarked or regression-tested repeatedly.
+
+Usage:
+  python football_scraper.py --pl --record matchday.har.gz
+  python football_scraper.py --pl --replay matchday.har.gz --replay-speed 0
+"""
+
+import base64
+import gzip
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+HAR_VERSION = "1.2"
+DATE_IN_URL = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# The recorded body is already decoded, so these no longer describe it
+DROPPED_RESPONSE_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class HttpArchive:
+    """An ordered list of HAR entries plus the date they were recorded on"""
+
+    def __init__(self, entries: Optional[List[Dict]] = None, recorded_on: Optional[date] = None):
+        self.entries = entries or []
+        self.recorded_on = recorded_on or date.today()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str) -> "HttpArchive":
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            har = json.load(f)["log"]
+        recorded_on = har.get("_recordedOn")
+        return cls(har["entries"], date.fromisoformat(recorded_on) if recorded_on else None)
+
+    def save(self, path: str):
+        """Write the archive atomically, so an interrupted run never leaves half a file"""
+        with self._lock:
+            har = {
+                "log": {
+                    "version": HAR_VERSION,
+                    "creator": {"name": "footyres", "version": "1"},
+                    "_recordedOn": self.recorded_on.isoformat(),
+                    "entries": list(self.entries),
+                }
+            }
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as f:
+                json.dump(har, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def add(self, entry: Dict):
+        with self._lock:
+            self.entries.append(entry)
+
+
+def har_headers(headers) -> List[Dict[str, str]]:
+    return [{"name": name, "value": value} for name, value in headers.items()]
+
+
+def to_entry(
+    request: requests.PreparedRequest, response: requests.Response, started: float, elapsed: float
+) -> Dict:
+    body = response.content or b""
+    return {
+        "startedDateTime": datetime.fromtimestamp(started).astimezone().isoformat(),
+        "time": elapsed * 1000,
+        "request": {
+            "method": request.method,
+            "url": request.url,
+            "headers": har_headers(request.headers),
+        },
+        "response": {
+            "status": response.status_code,
+            "statusText": response.reason or "",
+            "headers": har_headers(response.headers),
+            "content": {
+                "size": len(body),
+                "mimeType": response.headers.get("Content-Type", ""),
+                "text": base64.b64encode(body).decode("ascii"),
+                "encoding": "base64",
+            },
+        },
+    }
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Normal transport that also appends every exchange to an archive"""
+
+    def __init__(self, archive: HttpArchive, **kwargs):
+        super().__init__(**kwargs)
+        self.archive = archive
+
+    def send(self, request, **kwargs):
+        started = time.time()
+        response = super().send(request, **kwargs)
+        # Read the body now (it stays cached on the response for the caller) so the
+        # recorded time covers the whole download; Session sets .elapsed only later
+        response.content
+        elapsed = time.time() - started
+        self.archive.add(to_entry(request, response, started, elapsed))
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """Answer requests from an archive; unknown URLs fail like a network error
+
+    Repeated requests for the same URL get the recorded responses in order,
+    then the last one again, so polling loops keep running. Dates in URLs are
+    shifted by the days since recording, so "yesterday" still finds the
+    recorded yesterday.
+    """
+
+    def __init__(self, archive: HttpArchive, speed: float = 1.0):
+        super().__init__()
+        self.speed = speed
+        self.shift = timedelta(days=(date.today() - archive.recorded_on).days)
+        self.responses: Dict[Tuple[str, str], List[Dict]] = defaultdict(list)
+        for entry in archive.entries:
+            key = (entry["request"]["method"], entry["request"]["url"])
+            self.responses[key].append(entry)
+        self.served: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def shift_dates(self, url: str) -> str:
+        def shifted(match):
+            try:
+                return (date.fromisoformat(match.group(0)) - self.shift).isoformat()
+            except ValueError:
+                return match.group(0)
+
+        return DATE_IN_URL.sub(shifted, url)
+
+    def lookup(self, method: str, url: str) -> Optional[Dict]:
+        with self._lock:
+            for key in ((method, url), (method, self.shift_dates(url))):
+                entries = self.responses.get(key)
+                if entries:
+                    index = self.served[key]
+                    self.served[key] = index + 1
+                    return entries[min(index, len(entries) - 1)]
+        return None
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        entry = self.lookup(request.method, request.url)
+        if entry is None:
+            raise requests.ConnectionError(
+                f"No recorded response for {request.method} {request.url}", request=request
+            )
+
+        if self.speed > 0:
+            time.sleep(entry.get("time", 0) / 1000 / self.speed)
+
+        recorded = entry["response"]
+        content = recorded.get("content", {})
+        body = content.get("text", "")
+        body = base64.b64decode(body) if content.get("encoding") == "base64" else body.encode("utf-8")
+
+        response = requests.Response()
+        response.status_code = recorded["status"]
+        response.reason = recorded.get("statusText", "")
+        response.headers = CaseInsensitiveDict(
+            (header["name"], header["value"])
+            for header in recorded.get("headers", [])
+            if header["name"].lower() not in DROPPED_RESPONSE_HEADERS
+        )
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = body
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(milliseconds=entry.get("time", 0))
+        return response
+
+    def close(self):
+        pass
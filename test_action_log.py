@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+
+# Add current directory to path so we can import the scraper
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from football_scraper import ActionLog, MatchDetails, read_match_details
+from football_stats import SeasonStore
+
+
+def goals(player, *minutes):
+    """A player's goals entry; a minute ending in "p" is a penalty"""
+    return {
+        "playerName": player,
+        "actionType": "goal",
+        "actions": [
+            {"type": "Penalty" if minute.endswith("p") else "Goal", "timeLabel": {"value": minute.rstrip("p")}}
+            for minute in minutes
+        ],
+    }
+
+
+def red_card(player, minute):
+    return {
+        "playerName": player,
+        "actionType": "card",
+        "actions": [{"type": "Red Card", "timeLabel": {"value": minute}}],
+    }
+
+
+# One team's actions as successive polls of a match see them: a player's later
+# goals are appended to their own entry, not after the other scorers
+POLLS = [
+    [goals("A", "10'")],
+    [goals("A", "10'"), goals("B", "30'")],
+    [goals("A", "10'"), goals("B", "30'"), red_card("C", "55'")],
+    [goals("A", "10'", "80'"), goals("B", "30'"), red_card("C", "55'")],
+    [goals("A", "10'", "80'"), goals("B", "30'", "90+2'p"), red_card("C", "55'")],
+]
+
+
+def test_incremental_matches_fresh_parse():
+    print("Comparing polled action logs with a fresh read of each page...")
+
+    home_log, away_log = ActionLog(), ActionLog()
+    for poll, actions in enumerate(POLLS, 1):
+        details = MatchDetails(actions, [])
+        incremental = read_match_details(details, home_log, away_log)
+        fresh = read_match_details(details)
+        assert incremental == fresh, f"poll {poll}: {incremental} != {fresh}"
+
+    assert fresh["home_scorers"] == ["⚽ A 10'", "⚽ A 80'", "⚽ B 30'", "⚽ B 90+2' (pen)"]
+    assert fresh["home_cards"] == ["🟥 C 55'"]
+    print("✅ Scorers and cards come out in page order however many polls built them")
+
+
+def test_reordered_scorers_are_not_a_correction():
+    print("Re-storing a result whose scorers are listed in another order...")
+
+    match = {"home_team": "X", "away_team": "Y", "home_score": "3", "away_score": "0", "status": "FT"}
+    store = SeasonStore()
+    assert store.apply("2025-08-16", "Premier League", dict(match, home_scorers=["⚽ A 10'", "⚽ B 30'", "⚽ A 80'"]))
+    assert not store.apply("2025-08-16", "Premier League", dict(match, home_scorers=["⚽ A 10'", "⚽ A 80'", "⚽ B 30'"]))
+    assert len(store) == 1
+    print("✅ Same goals in another order leave the stored result alone")
+
+
+if __name__ == "__main__":
+    test_incremental_matches_fresh_parse()
+    test_reordered_scorers_are_not_a_correction()
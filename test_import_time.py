@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+import os
+import re
+import subprocess
+import sys
+
+# Importing the scraper must stay cheap: one-shot CLI calls and --help pay it every time
+IMPORT_BUDGET_MS = 50
+HEAVY_MODULES = ["requests", "bs4", "colorama", "urllib3"]
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def measure_import():
+    """Import football_scraper in a fresh interpreter with -X importtime"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import football_scraper"],
+        cwd=SCRIPT_DIR,
+        capture_output=True,
+        text=True,
+    )
+    imported = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        match = re.match(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s*(\S+)", line)
+        if match:
+            imported[match.group(3)] = int(match.group(2))
+    return imported
+
+
+def test_import_time():
+    print("Measuring football_scraper import time...")
+
+    imported = measure_import()
+    assert "football_scraper" in imported, "football_scraper was not imported"
+
+    cumulative_ms = imported["football_scraper"] / 1000
+    print(f"  football_scraper: {cumulative_ms:.1f} ms (budget {IMPORT_BUDGET_MS} ms)")
+
+    eager = [name for name in HEAVY_MODULES if name in imported]
+    assert not eager, f"Imported at module load: {', '.join(eager)}"
+    assert cumulative_ms < IMPORT_BUDGET_MS, (
+        f"Import took {cumulative_ms:.1f} ms, budget is {IMPORT_BUDGET_MS} ms"
+    )
+
+    print("✅ Import stays within budget")
+
+
+if __name__ == "__main__":
+    test_import_time()
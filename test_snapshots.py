@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks"))
+
+from bbc_standin import start_standin
+
+from football_scraper import LazyMatch, SnapshotStore
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_cli_snapshot_loads_from_imported_module():
+    print("Round-tripping a CLI-written snapshot through the imported module...")
+
+    server, url = start_standin()
+    try:
+        with tempfile.TemporaryDirectory(prefix="footyres-test-") as cache_dir:
+            # Run as a script, so any class it pickles would be recorded as __main__.<name>
+            result = subprocess.run(
+                [sys.executable, "football_scraper.py", "--pl", "--format", "json", "--bbc-url", url],
+                cwd=SCRIPT_DIR,
+                env=dict(os.environ, FOOTYRES_CACHE_DIR=cache_dir),
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+            assert result.returncode == 0, result.stderr
+
+            snapshot = SnapshotStore(cache_dir).load(f"matches-{date.today().isoformat()}")
+            assert snapshot is not None, "Snapshot written by the CLI did not load"
+            matches = [match for league in snapshot[1].values() for match in league]
+            assert matches, "Snapshot has no matches"
+            # Snapshots are written as soon as a page is parsed, before anything reads the details
+            assert all(type(match) is LazyMatch for match in matches)
+            assert all(match._details is not None for match in matches)
+            assert all("home_scorers" in match for match in matches)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print("✅ Snapshot loads with matches whose details are still unread")
+
+
+if __name__ == "__main__":
+    test_cli_snapshot_loads_from_imported_module()
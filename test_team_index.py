@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+
+# Add current directory to path so we can import the scraper
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from football_scraper import FootballScraper, reference_data
+from football_standings import StandingsBook, find_row
+
+# Typed or scraped name -> the team it must resolve to (None: no match at all)
+EXPECTED = {
+    "man utd": "Manchester United",
+    "Spurs": "Tottenham Hotspur",
+    "Bournemouth": "AFC Bournemouth",
+    "Milan": "AC Milan",
+    "Atletico": "Atlético Madrid",
+    "Real Madrid CF": "Real Madrid",
+    "Manchester United FC": "Manchester United",
+    "liverpol": "Liverpool",
+    # Other clubs that share a word or most letters with a known one
+    "Rangers": None,
+    "Paris FC": None,
+    "Newcastle Jets": None,
+    "Sporting Kansas City": None,
+}
+
+
+def test_team_lookup():
+    print("Checking team name lookups...")
+
+    index = reference_data().team_index
+    wrong = []
+    for query, team in EXPECTED.items():
+        match = index.lookup(query)
+        found = match.team if match is not None else None
+        print(f"  {query!r} -> {found!r}")
+        if found != team:
+            wrong.append(f"{query!r}: expected {team!r}, got {found!r}")
+
+    assert not wrong, "; ".join(wrong)
+    print("✅ Team lookups resolve to the right club or to nothing")
+
+
+def test_table_row_lookup():
+    print("Checking fixture names against table rows...")
+
+    rows = {team.lower(): {"team": team} for team in ("Inter Milan", "Manchester United")}
+    assert find_row(rows, "Man Utd") is rows["manchester united"]
+    assert find_row(rows, "Inter") is rows["inter milan"]
+    # Contained in "Inter Milan", but another club
+    assert find_row(rows, "Milan") is None
+    assert find_row(rows, "Manchester") is None
+    print("✅ Fixture names find their own club's row or none")
+
+
+def test_stored_team_lookup():
+    print("Checking typed names against teams in the standings book...")
+
+    def result(home, away):
+        return {"home_team": home, "away_team": away, "home_score": "1", "away_score": "0", "status": "FT"}
+
+    book = StandingsBook()
+    book.update(
+        "2025-08-16",
+        {
+            "Championship": [result("Queens Park Rangers", "Watford")],
+            "Premier League": [result("Manchester United", "Arsenal")],
+            "Serie A": [result("Inter Milan", "Napoli")],
+        },
+    )
+    assert book.find_team("arsenal") == "Arsenal"
+    assert book.find_team("Queens Park Rangers") == "Queens Park Rangers"
+    assert book.find_team("man utd") == "Manchester United"
+    # Part of a stored name, but another club (or none in particular)
+    assert book.find_team("Rangers") is None
+    assert book.find_team("Milan") is None
+    assert book.find_team("Manchester") is None
+    print("✅ Stored teams are found by name or alias, never by substring")
+
+
+def test_table_row_form():
+    print("Checking stored form for table rows named unlike the fixtures...")
+
+    book = StandingsBook()
+    for day, (home, away, home_score) in enumerate(
+        [("Manchester United", "Arsenal", "2"), ("Fulham", "Manchester United", "1")], 16
+    ):
+        book.update(
+            f"2025-08-{day}",
+            {"Premier League": [{"home_team": home, "away_team": away, "home_score": home_score, "away_score": "1", "status": "FT"}]},
+        )
+    assert book.form("Man Utd", "Premier League") == "WD"
+    assert book.form("Manchester", "Premier League") == ""
+
+    scraper = FootballScraper()
+    row = {"team": "Man Utd", "played": 2}
+    # No league: no stored fallback, so the book is not loaded
+    assert scraper.generate_team_form(row, 2) == ""
+    assert scraper._standings is None
+    scraper._standings = book
+    assert scraper.generate_team_form(row, 2, "Premier League").count("\033[30m") == 2
+    print("✅ Table rows get stored form under their fixture name")
+
+
+if __name__ == "__main__":
+    test_team_lookup()
+    test_table_row_lookup()
+    test_stored_team_lookup()
+    test_table_row_form()